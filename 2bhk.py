@@ -1,83 +1,366 @@
 import bpy
 import bmesh
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from mathutils import Vector
+import logging
 import math
+import os
 import random
+import numpy as np
+
+# numba is optional: it is not in requirements.txt (that file is for the Django
+# app), so install it into Blender's own Python to JIT-compile the njit helpers;
+# without it they run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Progress messages; set HOUSE_VERBOSE=0 to silence them
+log = logging.getLogger('house2bhk')
+
+# Geometry of the shared primitives: a unit cube (same as primitive_cube_add(size=1))
+# and a radius-1, depth-1 cylinder that objects scale to the wanted radius/depth
+_UNIT_CUBE_VERTS = [
+    (-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, 0.5, -0.5), (-0.5, 0.5, -0.5),
+    (-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0.5, 0.5, 0.5), (-0.5, 0.5, 0.5),
+]
+_UNIT_CUBE_FACES = [
+    (0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4),
+    (2, 3, 7, 6), (3, 0, 4, 7), (1, 2, 6, 5),
+]
+_UNIT_CUBE_ARRAY = np.array(_UNIT_CUBE_VERTS, dtype=np.float32)
+_UNIT_CUBE_INDICES = np.array(_UNIT_CUBE_FACES, dtype=np.int32)
+_CYLINDER_SEGMENTS = 32
+_PRIMITIVE_KINDS = ('cube', 'cylinder')
+
+# Constant rotations: handles turned 90 degrees about Y, sun tilted 60 and turned 45 degrees
+_HALF_PI = math.pi / 2
+_HANDLE_ROTATION = (0.0, _HALF_PI, 0.0)
+_SUN_ROTATION = (math.pi / 3, 0.0, math.pi / 4)
+
+# Primitive meshes shared by every object of the same kind
+_PRIMITIVE_MESHES = {}
+
+# Materials already built by create_advanced_material, keyed by their arguments
+_MATERIAL_CACHE = {}
+
+# Shader node groups shared by the procedural materials, keyed by pattern
+_NODE_GROUPS = {}
+
+# Objects created by the builders, keyed by name
+_OBJ_CACHE = {}
+
+# Principled BSDF -> Material Output material that create_advanced_material copies
+_MATERIAL_TEMPLATE = None
+
+def _cylinder_geometry(segments=_CYLINDER_SEGMENTS):
+    """Vertices and faces of a unit cylinder centred on the origin"""
+    ring = [(math.cos(2 * math.pi * i / segments), math.sin(2 * math.pi * i / segments))
+            for i in range(segments)]
+    verts = [(x, y, -0.5) for x, y in ring] + [(x, y, 0.5) for x, y in ring]
+    faces = [(i, (i + 1) % segments, segments + (i + 1) % segments, segments + i)
+             for i in range(segments)]
+    faces.append(tuple(reversed(range(segments))))
+    faces.append(tuple(range(segments, 2 * segments)))
+    return verts, faces
+
+_PRIMITIVE_GEOMETRY = {
+    'cube': (_UNIT_CUBE_ARRAY, _UNIT_CUBE_INDICES),
+    'cylinder': _cylinder_geometry(),
+}
+
+def _mesh_from_arrays(name, verts, faces, slot_count=1):
+    """Build a mesh by writing flat vertex/loop/polygon buffers with foreach_set instead of from_pydata"""
+    verts = np.asarray(verts, dtype=np.float32)
+    if isinstance(faces, np.ndarray):
+        loop_total = np.full(len(faces), faces.shape[1], dtype=np.int32)
+        vertex_index = faces.ravel()
+    else:
+        loop_total = np.array([len(face) for face in faces], dtype=np.int32)
+        vertex_index = np.concatenate(faces)
+    loop_start = np.zeros(len(loop_total), dtype=np.int32)
+    np.cumsum(loop_total[:-1], out=loop_start[1:])
+    
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", verts.ravel())
+    mesh.loops.add(len(vertex_index))
+    mesh.loops.foreach_set("vertex_index", vertex_index.astype(np.int32, copy=False))
+    mesh.polygons.add(len(loop_total))
+    mesh.polygons.foreach_set("loop_start", loop_start)
+    mesh.polygons.foreach_set("loop_total", loop_total)
+    # Keep empty slots so objects can link their own materials to them
+    for _ in range(slot_count):
+        mesh.materials.append(None)
+    mesh.update(calc_edges=True)
+    return mesh
+
+def _primitive_mesh(kind):
+    """Return the shared mesh for a primitive kind ('cube' or 'cylinder'), building it once"""
+    mesh = _PRIMITIVE_MESHES.get(kind)
+    if mesh is None:
+        verts, faces = _PRIMITIVE_GEOMETRY[kind]
+        mesh = _mesh_from_arrays(f"Unit_{kind.capitalize()}", verts, faces)
+        _PRIMITIVE_MESHES[kind] = mesh
+    return mesh
+
+def _spawn(name, mesh, scale, location, rotation=None):
+    """Create an object instancing mesh without going through bpy.ops; the caller links it"""
+    obj = bpy.data.objects.new(name, mesh)
+    obj.scale = scale
+    obj.location = location
+    if rotation is not None:
+        obj.rotation_euler = rotation
+    return obj
+
+def _spawn_cube(name, scale, location, rotation=None):
+    """Create a box object sharing the unit cube mesh"""
+    return _spawn(name, _primitive_mesh('cube'), scale, location, rotation)
+
+def _spawn_cylinder(name, radius, depth, location, rotation=None):
+    """Create a cylinder object sharing the unit cylinder mesh"""
+    return _spawn(name, _primitive_mesh('cylinder'), (radius, radius, depth), location, rotation)
+
+def _box_batch_geometry(scales, locations, material_indices):
+    """World-space vertices, quads and per-face material indices of many axis-aligned boxes"""
+    scales = np.asarray(scales, dtype=np.float32)
+    locations = np.asarray(locations, dtype=np.float32)
+    count = len(scales)
+    
+    # (N, 8, 3) world-space corners and (N, 6, 4) face indices offset per box
+    verts = np.einsum('vk,nk->nvk', _UNIT_CUBE_ARRAY, scales) + locations[:, None, :]
+    faces = _UNIT_CUBE_INDICES[None, :, :] + (np.arange(count, dtype=np.int32) * 8)[:, None, None]
+    face_materials = np.repeat(np.asarray(material_indices, dtype=np.int32), 6)
+    return verts.reshape(-1, 3), faces.reshape(-1, 4), face_materials
+
+def _build_box_batch(name, geometry, slot_count):
+    """Create one object holding many boxes from geometry returned by _box_batch_geometry"""
+    verts, faces, face_materials = geometry
+    mesh = _mesh_from_arrays(name, verts, faces, slot_count)
+    mesh.polygons.foreach_set("material_index", face_materials)
+    return bpy.data.objects.new(name, mesh)
+
+def get_obj(name):
+    """Return the scene object called name, remembering it for later lookups"""
+    obj = _OBJ_CACHE.get(name)
+    if obj is None or obj.name != name:
+        obj = bpy.data.objects.get(name)
+        if obj is not None:
+            _OBJ_CACHE[name] = obj
+    return obj
+
+def _link_objects(objects):
+    """Link a builder's objects into the active collection in one batch"""
+    link = bpy.context.collection.objects.link
+    for obj in objects:
+        link(obj)
+        _OBJ_CACHE[obj.name] = obj
+
+def _populate_collection(name, objects, **transforms):
+    """Link objects into a new scene collection, writing each transform array with one foreach_set"""
+    collection = bpy.data.collections.new(name)
+    bpy.context.scene.collection.children.link(collection)
+    for obj in objects:
+        collection.objects.link(obj)
+        _OBJ_CACHE[obj.name] = obj
+    for prop, values in transforms.items():
+        collection.objects.foreach_set(prop, np.asarray(values, dtype=np.float32).ravel())
+    return collection
+
+def _assign_material(obj, material, index=0):
+    """Link material to one of the object's existing slots, leaving the shared mesh untouched"""
+    slot = obj.material_slots[index]
+    slot.link = 'OBJECT'
+    slot.material = material
+
+# bpy.data collection owning each datablock type that clear_scene removes
+_ID_COLLECTIONS = (
+    (bpy.types.Object, 'objects'), (bpy.types.Mesh, 'meshes'), (bpy.types.Material, 'materials'),
+    (bpy.types.Light, 'lights'), (bpy.types.Camera, 'cameras'), (bpy.types.NodeTree, 'node_groups'),
+    (bpy.types.Collection, 'collections'),
+)
+
+def _remove_ids(ids):
+    """Delete datablocks in one batch, or one at a time on Blender versions without batch_remove"""
+    if not ids:
+        return
+    try:
+        bpy.data.batch_remove(ids=ids)
+    except AttributeError:
+        for block in ids:
+            attr = next(attr for id_type, attr in _ID_COLLECTIONS if isinstance(block, id_type))
+            getattr(bpy.data, attr).remove(block)
 
 def clear_scene():
     """Clear all objects from the scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete(use_global=False)
+    global _MATERIAL_TEMPLATE
+    _remove_ids(list(bpy.data.objects))
+    
+    # Purge the data left without users so reruns start from an empty file; node groups
+    # and collections only become unused once the materials and objects are gone
+    _remove_ids([block
+                 for datablocks in (bpy.data.meshes, bpy.data.materials, bpy.data.lights, bpy.data.cameras)
+                 for block in datablocks if block.users == 0])
+    _remove_ids([group for group in bpy.data.node_groups if group.users == 0] +
+                [collection for collection in bpy.data.collections if not collection.all_objects])
+    _PRIMITIVE_MESHES.clear()
+    _MATERIAL_CACHE.clear()
+    _NODE_GROUPS.clear()
+    _OBJ_CACHE.clear()
+    _MATERIAL_TEMPLATE = None
+
+def _add_group_socket(group, in_out, name):
+    """Add a colour socket to a node group interface (Blender 4.0+ or 3.x API)"""
+    if hasattr(group, 'interface'):
+        group.interface.new_socket(name, in_out=in_out, socket_type='NodeSocketColor')
+    elif in_out == 'INPUT':
+        group.inputs.new('NodeSocketColor', name)
+    else:
+        group.outputs.new('NodeSocketColor', name)
+
+def _mix_node(nodes, blend_type, factor=1.0):
+    """Add a colour Mix node; sockets 0/6/7 and output 2 are its float factor and colour A/B/result"""
+    mix = nodes.new(type='ShaderNodeMix')
+    mix.data_type = 'RGBA'
+    mix.blend_type = blend_type
+    mix.inputs[0].default_value = factor
+    return mix
+
+def _build_brick_group():
+    """Brick pattern with darker alternate bricks and noise variation, driven by one base colour"""
+    group = bpy.data.node_groups.new("Brick_Pattern", 'ShaderNodeTree')
+    _add_group_socket(group, 'INPUT', 'Color')
+    _add_group_socket(group, 'OUTPUT', 'Color')
+    nodes = group.nodes
+    links = group.links
+    group_in = nodes.new(type='NodeGroupInput')
+    group_out = nodes.new(type='NodeGroupOutput')
+    tex_coord = nodes.new(type='ShaderNodeTexCoord')
+    
+    brick_tex = nodes.new(type='ShaderNodeTexBrick')
+    brick_tex.inputs['Scale'].default_value = 8.0
+    brick_tex.inputs['Mortar Size'].default_value = 0.02
+    brick_tex.inputs['Bias'].default_value = 0.0
+    brick_tex.inputs['Mortar'].default_value = (0.9, 0.9, 0.85, 1.0)
+    
+    # Alternate bricks are the base colour darkened to 70%
+    darker = _mix_node(nodes, 'MULTIPLY')
+    darker.inputs[7].default_value = (0.7, 0.7, 0.7, 1.0)
+    
+    # Add noise for variation
+    noise_tex = nodes.new(type='ShaderNodeTexNoise')
+    noise_tex.inputs['Scale'].default_value = 15.0
+    noise_tex.inputs['Detail'].default_value = 2.0
+    color_mix = _mix_node(nodes, 'MULTIPLY', 0.1)
+    
+    links.new(group_in.outputs['Color'], brick_tex.inputs['Color1'])
+    links.new(group_in.outputs['Color'], darker.inputs[6])
+    links.new(darker.outputs[2], brick_tex.inputs['Color2'])
+    links.new(tex_coord.outputs['Generated'], brick_tex.inputs['Vector'])
+    links.new(tex_coord.outputs['Generated'], noise_tex.inputs['Vector'])
+    links.new(brick_tex.outputs['Color'], color_mix.inputs[6])
+    links.new(noise_tex.outputs['Fac'], color_mix.inputs[7])
+    links.new(color_mix.outputs[2], group_out.inputs['Color'])
+    return group
+
+def _build_wood_group():
+    """Banded wood grain blending a dark and a light tint of one base colour"""
+    group = bpy.data.node_groups.new("Wood_Grain", 'ShaderNodeTree')
+    _add_group_socket(group, 'INPUT', 'Color')
+    _add_group_socket(group, 'OUTPUT', 'Color')
+    nodes = group.nodes
+    links = group.links
+    group_in = nodes.new(type='NodeGroupInput')
+    group_out = nodes.new(type='NodeGroupOutput')
+    tex_coord = nodes.new(type='ShaderNodeTexCoord')
+    mapping = nodes.new(type='ShaderNodeMapping')
+    mapping.inputs['Scale'].default_value = (0.1, 2.0, 0.1)
+    
+    wood_tex = nodes.new(type='ShaderNodeTexWave')
+    wood_tex.inputs['Scale'].default_value = 12.0
+    wood_tex.inputs['Distortion'].default_value = 0.5
+    wood_tex.inputs['Detail'].default_value = 2.0
+    wood_tex.wave_type = 'BANDS'
+    wood_tex.rings_direction = 'Z'
+    
+    # Wood color variation between a dark and a light tint
+    dark = _mix_node(nodes, 'MULTIPLY')
+    dark.inputs[7].default_value = (0.6, 0.4, 0.2, 1.0)
+    light = _mix_node(nodes, 'MULTIPLY')
+    light.inputs[7].default_value = (1.2, 0.8, 0.4, 1.0)
+    grain = _mix_node(nodes, 'MIX')
+    
+    links.new(tex_coord.outputs['Generated'], mapping.inputs['Vector'])
+    links.new(mapping.outputs['Vector'], wood_tex.inputs['Vector'])
+    links.new(group_in.outputs['Color'], dark.inputs[6])
+    links.new(group_in.outputs['Color'], light.inputs[6])
+    links.new(wood_tex.outputs['Fac'], grain.inputs[0])
+    links.new(dark.outputs[2], grain.inputs[6])
+    links.new(light.outputs[2], grain.inputs[7])
+    links.new(grain.outputs[2], group_out.inputs['Color'])
+    return group
+
+_NODE_GROUP_BUILDERS = {
+    'brick_wall': _build_brick_group,
+    'wood_floor': _build_wood_group,
+}
+
+def _node_group(texture_type):
+    """Return the shared node group for a texture type, building it once"""
+    group = _NODE_GROUPS.get(texture_type)
+    if group is None:
+        group = _NODE_GROUP_BUILDERS[texture_type]()
+        _NODE_GROUPS[texture_type] = group
+    return group
+
+def _material_template():
+    """Return the base material every advanced material is copied from, building it once"""
+    global _MATERIAL_TEMPLATE
+    if _MATERIAL_TEMPLATE is None:
+        template = bpy.data.materials.new(name="Material_Template")
+        template.use_nodes = True
+        nodes = template.node_tree.nodes
+        nodes.clear()
+        bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
+        output = nodes.new(type='ShaderNodeOutputMaterial')
+        template.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
+        _MATERIAL_TEMPLATE = template
+    return _MATERIAL_TEMPLATE
 
 def create_advanced_material(name, base_color, roughness=0.8, metallic=0.0, texture_type=None, normal_strength=1.0):
     """Create advanced materials with procedural textures and normal maps"""
-    mat = bpy.data.materials.new(name=name)
-    mat.use_nodes = True
+    key = (name, tuple(base_color), roughness, metallic, texture_type, normal_strength)
+    mat = _MATERIAL_CACHE.get(key)
+    if mat is not None:
+        return mat
+    
+    # Copy the Principled BSDF -> Output template instead of rebuilding it
+    mat = _material_template().copy()
+    mat.name = name
     nodes = mat.node_tree.nodes
     links = mat.node_tree.links
-    
-    # Clear default nodes
-    nodes.clear()
-    
-    # Add Principled BSDF
-    bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
+    bsdf = nodes['Principled BSDF']
     bsdf.inputs['Base Color'].default_value = (*base_color, 1.0)
     bsdf.inputs['Roughness'].default_value = roughness
     bsdf.inputs['Metallic'].default_value = metallic
     
-    # Texture coordinate and mapping nodes
-    tex_coord = nodes.new(type='ShaderNodeTexCoord')
-    mapping = nodes.new(type='ShaderNodeMapping')
-    
-    if texture_type == 'brick_wall':
-        # Advanced brick texture with variation
-        brick_tex = nodes.new(type='ShaderNodeTexBrick')
-        brick_tex.inputs['Scale'].default_value = 8.0
-        brick_tex.inputs['Mortar Size'].default_value = 0.02
-        brick_tex.inputs['Bias'].default_value = 0.0
-        brick_tex.inputs['Color1'].default_value = (*base_color, 1.0)
-        brick_tex.inputs['Color2'].default_value = (base_color[0]*0.7, base_color[1]*0.7, base_color[2]*0.7, 1.0)
-        brick_tex.inputs['Mortar'].default_value = (0.9, 0.9, 0.85, 1.0)
-        
-        # Add noise for variation
-        noise_tex = nodes.new(type='ShaderNodeTexNoise')
-        noise_tex.inputs['Scale'].default_value = 15.0
-        noise_tex.inputs['Detail'].default_value = 2.0
-        
-        color_mix = nodes.new(type='ShaderNodeMix')
-        color_mix.data_type = 'RGBA'
-        color_mix.blend_type = 'MULTIPLY'
-        color_mix.inputs['Fac'].default_value = 0.1
-        
-        links.new(tex_coord.outputs['Generated'], mapping.inputs['Vector'])
-        links.new(mapping.outputs['Vector'], brick_tex.inputs['Vector'])
-        links.new(mapping.outputs['Vector'], noise_tex.inputs['Vector'])
-        links.new(brick_tex.outputs['Color'], color_mix.inputs['Color1'])
-        links.new(noise_tex.outputs['Fac'], color_mix.inputs['Color2'])
-        links.new(color_mix.outputs['Color'], bsdf.inputs['Base Color'])
-        
-    elif texture_type == 'wood_floor':
-        # Realistic wood texture
-        mapping.inputs['Scale'].default_value = (0.1, 2.0, 0.1)
-        wood_tex = nodes.new(type='ShaderNodeTexWave')
-        wood_tex.inputs['Scale'].default_value = 12.0
-        wood_tex.inputs['Distortion'].default_value = 0.5
-        wood_tex.inputs['Detail'].default_value = 2.0
-        wood_tex.wave_type = 'BANDS'
-        wood_tex.rings_direction = 'Z'
-        
-        # Wood color variation
-        color_ramp = nodes.new(type='ShaderNodeValToRGB')
-        color_ramp.color_ramp.elements[0].color = (base_color[0]*0.6, base_color[1]*0.4, base_color[2]*0.2, 1.0)
-        color_ramp.color_ramp.elements[1].color = (base_color[0]*1.2, base_color[1]*0.8, base_color[2]*0.4, 1.0)
-        
-        links.new(tex_coord.outputs['Generated'], mapping.inputs['Vector'])
-        links.new(mapping.outputs['Vector'], wood_tex.inputs['Vector'])
-        links.new(wood_tex.outputs['Fac'], color_ramp.inputs['Fac'])
-        links.new(color_ramp.outputs['Color'], bsdf.inputs['Base Color'])
+    if texture_type in _NODE_GROUP_BUILDERS:
+        # Brick and wood patterns come from shared node groups fed the base colour
+        pattern = nodes.new(type='ShaderNodeGroup')
+        pattern.node_tree = _node_group(texture_type)
+        pattern.inputs['Color'].default_value = (*base_color, 1.0)
+        links.new(pattern.outputs['Color'], bsdf.inputs['Base Color'])
         
     elif texture_type == 'ceramic_tile':
         # Ceramic tile pattern
+        tex_coord = nodes.new(type='ShaderNodeTexCoord')
+        mapping = nodes.new(type='ShaderNodeMapping')
         tile_tex = nodes.new(type='ShaderNodeTexChecker')
         tile_tex.inputs['Scale'].default_value = 12.0
         tile_tex.inputs['Color1'].default_value = (*base_color, 1.0)
@@ -90,6 +373,8 @@ def create_advanced_material(name, base_color, roughness=0.8, metallic=0.0, text
         
     elif texture_type == 'marble':
         # Marble texture with veining
+        tex_coord = nodes.new(type='ShaderNodeTexCoord')
+        mapping = nodes.new(type='ShaderNodeMapping')
         marble_tex = nodes.new(type='ShaderNodeTexNoise')
         marble_tex.inputs['Scale'].default_value = 8.0
         marble_tex.inputs['Detail'].default_value = 2.0
@@ -116,260 +401,190 @@ def create_advanced_material(name, base_color, roughness=0.8, metallic=0.0, text
         bsdf.inputs['Metallic'].default_value = 1.0
         bsdf.inputs['Roughness'].default_value = 0.2
     
-    # Add output
-    output = nodes.new(type='ShaderNodeOutputMaterial')
-    links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-    
+    _MATERIAL_CACHE[key] = mat
     return mat
 
-def create_wall_with_opening(name, scale, location, opening_pos=None, opening_size=None):
-    """Create wall with door/window opening using boolean operations"""
-    # Create main wall
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    wall = bpy.context.active_object
-    wall.name = name
-    wall.scale = scale
-    wall.location = location
-    
-    # Create opening if specified
-    if opening_pos and opening_size:
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        opening = bpy.context.active_object
-        opening.name = f"{name}_Opening"
-        opening.scale = opening_size
-        opening.location = opening_pos
-        
-        # Boolean operation
-        modifier = wall.modifiers.new(name="Opening", type='BOOLEAN')
-        modifier.operation = 'DIFFERENCE'
-        modifier.object = opening
+def _wall_opening_geometry(scale, location, openings):
+    """Vertices and faces of a box wall minus any number of axis-aligned openings through it"""
+    # Work in (u, t, z) wall space: u runs along the wall, t through its thickness
+    along = 0 if scale[0] >= scale[1] else 1
+    half_u, half_t, half_z = scale[along] / 2, scale[1 - along] / 2, scale[2] / 2
+    
+    # Opening rectangles on the wall face, relative to the wall centre and clipped to it;
+    # together they act as one merged cutter
+    holes = []
+    for opening_pos, opening_size in openings:
+        hole_u = (max(-half_u, opening_pos[along] - location[along] - opening_size[along] / 2),
+                  min(half_u, opening_pos[along] - location[along] + opening_size[along] / 2))
+        hole_z = (max(-half_z, opening_pos[2] - location[2] - opening_size[2] / 2),
+                  min(half_z, opening_pos[2] - location[2] + opening_size[2] / 2))
+        if hole_u[0] < hole_u[1] and hole_z[0] < hole_z[1]:
+            holes.append((hole_u, hole_z))
+    
+    # Split the face into a grid on every opening edge; cells inside an opening are empty
+    us = sorted({-half_u, half_u, *(u for hole_u, _ in holes for u in hole_u)})
+    zs = sorted({-half_z, half_z, *(z for _, hole_z in holes for z in hole_z)})
+    
+    def solid(i, j):
+        if not (0 <= i < len(us) - 1 and 0 <= j < len(zs) - 1):
+            return False
+        return not any(hole_u[0] <= us[i] < hole_u[1] and hole_z[0] <= zs[j] < hole_z[1]
+                       for hole_u, hole_z in holes)
+    
+    def v(i, j, k):
+        return (i * len(zs) + j) * 2 + k
+    
+    verts = []
+    for u in us:
+        for z in zs:
+            for t in (-half_t, half_t):
+                verts.append((u, t, z) if along == 0 else (t, u, z))
+    
+    faces = []
+    for i in range(len(us) - 1):
+        for j in range(len(zs) - 1):
+            if not solid(i, j):
+                continue
+            faces.append((v(i, j, 0), v(i + 1, j, 0), v(i + 1, j + 1, 0), v(i, j + 1, 0)))
+            faces.append((v(i, j + 1, 1), v(i + 1, j + 1, 1), v(i + 1, j, 1), v(i, j, 1)))
+            # Side faces wherever the solid region borders the outside or the opening
+            if not solid(i, j - 1):
+                faces.append((v(i, j, 0), v(i, j, 1), v(i + 1, j, 1), v(i + 1, j, 0)))
+            if not solid(i, j + 1):
+                faces.append((v(i, j + 1, 0), v(i + 1, j + 1, 0), v(i + 1, j + 1, 1), v(i, j + 1, 1)))
+            if not solid(i - 1, j):
+                faces.append((v(i, j, 0), v(i, j + 1, 0), v(i, j + 1, 1), v(i, j, 1)))
+            if not solid(i + 1, j):
+                faces.append((v(i + 1, j, 0), v(i + 1, j, 1), v(i + 1, j + 1, 1), v(i + 1, j + 1, 0)))
+    
+    # Swapping x and y mirrors the wall space, so flip the winding to keep normals outward
+    if along == 1:
+        faces = [tuple(reversed(face)) for face in faces]
+    return verts, faces
+
+def _wall_meshdata(name, scale, location, openings=()):
+    """Geometry stage of a wall, safe off the main thread: its cut mesh data, or None for a plain box"""
+    # Wall and openings are all axis-aligned boxes, so build the cut mesh in one pass
+    # instead of evaluating a boolean modifier per opening
+    geometry = _wall_opening_geometry(scale, location, openings) if openings else None
+    return name, scale, location, geometry
+
+def _wall_object(name, scale, location, geometry):
+    """Object stage of a wall, main thread only: turn _wall_meshdata output into an object"""
+    if geometry is None:
+        return _spawn_cube(name, scale, location)
+    verts, faces = geometry
+    return _spawn(name, _mesh_from_arrays(name, verts, faces), (1, 1, 1), location)
+
+def create_wall_with_opening(name, scale, location, openings=()):
+    """Create wall with its door/window openings, given as (position, size) pairs, cut directly into its mesh"""
+    return _wall_object(*_wall_meshdata(name, scale, location, openings))
+
+def _wall_spec(hw, hl, wh, wt):
+    """Walls of the 2BHK as (name, scale, location, openings) rows, openings being (position, size) pairs"""
+    iwt = wt * 0.7  # interior walls are thinner
+    return [
+        # EXTERIOR WALLS: front with main entrance, back with kitchen window,
+        # left with both bedroom windows, right with living room window
+        ("Front_Wall", (hw, wt, wh), (0, -hl/2, wh/2), [((2.0, -hl/2, 1.0), (0.9, wt + 0.1, 2.1))]),
+        ("Back_Wall", (hw, wt, wh), (0, hl/2, wh/2), [((3.0, hl/2, 1.5), (1.5, wt + 0.1, 1.2))]),
+        ("Left_Wall", (wt, hl, wh), (-hw/2, 0, wh/2),
+         [((-hw/2, 2.5, 1.5), (wt + 0.1, 1.5, 1.2)), ((-hw/2, -0.75, 1.5), (wt + 0.1, 1.5, 1.2))]),
+        ("Right_Wall", (wt, hl, wh), (hw/2, 0, wh/2), [((hw/2, -1.5, 1.5), (wt + 0.1, 2.0, 1.2))]),
         
-        # Apply modifier
-        bpy.context.view_layer.objects.active = wall
-        bpy.ops.object.modifier_apply(modifier="Opening")
+        # INTERIOR WALLS: partition separating bedrooms from living area, bedroom
+        # separators and kitchen partition with their doors
+        ("Main_Partition_Wall", (iwt, hl * 0.75, wh), (hw * 0.15, 0.5, wh/2), []),
+        ("Master_Bedroom_Wall", (hw * 0.35, iwt, wh), (-hw * 0.175, hl * 0.2, wh/2),
+         [((-hw * 0.175, hl * 0.2 + 0.05, 1.0), (0.8, wt + 0.1, 2.0))]),
+        ("Bedroom2_Wall", (hw * 0.35, iwt, wh), (-hw * 0.175, -hl * 0.15, wh/2),
+         [((-hw * 0.175, -hl * 0.15 + 0.05, 1.0), (0.8, wt + 0.1, 2.0))]),
+        ("Kitchen_Partition", (iwt, hl * 0.4, wh), (hw * 0.32, hl * 0.3, wh/2),
+         [((hw * 0.32 + 0.05, hl * 0.25, 1.0), (wt + 0.1, 0.8, 2.0))]),
         
-        # Remove opening object
-        bpy.data.objects.remove(opening, do_unlink=True)
-    
-    return wall
-
-def create_2bhk_structure():
-    """Create the main structure of 2BHK house"""
-    # House dimensions (realistic proportions)
-    house_width = 9.0   # 9 meters width
-    house_length = 11.0  # 11 meters length
-    wall_height = 3.0    # 3 meters height
-    wall_thickness = 0.23  # 230mm standard wall thickness
-    
-    walls = []
-    
-    # EXTERIOR WALLS
-    # Front wall with main entrance
-    front_wall = create_wall_with_opening(
-        "Front_Wall", 
-        (house_width, wall_thickness, wall_height),
-        (0, -house_length/2, wall_height/2),
-        (2.0, -house_length/2, 1.0),  # Door opening position
-        (0.9, wall_thickness + 0.1, 2.1)  # Door opening size
-    )
-    walls.append(front_wall)
-    
-    # Back wall with kitchen window
-    back_wall = create_wall_with_opening(
-        "Back_Wall",
-        (house_width, wall_thickness, wall_height),
-        (0, house_length/2, wall_height/2),
-        (3.0, house_length/2, 1.5),  # Kitchen window
-        (1.5, wall_thickness + 0.1, 1.2)
-    )
-    walls.append(back_wall)
-    
-    # Left wall with bedroom windows
-    left_wall = create_wall_with_opening(
-        "Left_Wall",
-        (wall_thickness, house_length, wall_height),
-        (-house_width/2, 0, wall_height/2),
-        (-house_width/2, 2.5, 1.5),  # Master bedroom window
-        (wall_thickness + 0.1, 1.5, 1.2)
-    )
-    walls.append(left_wall)
-    
-    # Right wall with living room window
-    right_wall = create_wall_with_opening(
-        "Right_Wall",
-        (wall_thickness, house_length, wall_height),
-        (house_width/2, 0, wall_height/2),
-        (house_width/2, -1.5, 1.5),  # Living room window
-        (wall_thickness + 0.1, 2.0, 1.2)
-    )
-    walls.append(right_wall)
-    
-    # INTERIOR WALLS
-    # Main partition wall (separating bedrooms from living area)
-    main_partition = create_wall_with_opening(
-        "Main_Partition_Wall",
-        (wall_thickness * 0.7, house_length * 0.75, wall_height),
-        (house_width * 0.15, 0.5, wall_height/2)
-    )
-    walls.append(main_partition)
-    
-    # Master bedroom separator
-    master_separator = create_wall_with_opening(
-        "Master_Bedroom_Wall",
-        (house_width * 0.35, wall_thickness * 0.7, wall_height),
-        (-house_width * 0.175, house_length * 0.2, wall_height/2),
-        (-house_width * 0.175, house_length * 0.2 + 0.05, 1.0),  # Door opening
-        (0.8, wall_thickness + 0.1, 2.0)
-    )
-    walls.append(master_separator)
-    
-    # Second bedroom separator
-    bedroom2_separator = create_wall_with_opening(
-        "Bedroom2_Wall", 
-        (house_width * 0.35, wall_thickness * 0.7, wall_height),
-        (-house_width * 0.175, -house_length * 0.15, wall_height/2),
-        (-house_width * 0.175, -house_length * 0.15 + 0.05, 1.0),  # Door opening
-        (0.8, wall_thickness + 0.1, 2.0)
-    )
-    walls.append(bedroom2_separator)
-    
-    # Kitchen partition
-    kitchen_wall = create_wall_with_opening(
-        "Kitchen_Partition",
-        (wall_thickness * 0.7, house_length * 0.4, wall_height),
-        (house_width * 0.32, house_length * 0.3, wall_height/2),
-        (house_width * 0.32 + 0.05, house_length * 0.25, 1.0),  # Kitchen door
-        (wall_thickness + 0.1, 0.8, 2.0)
-    )
-    walls.append(kitchen_wall)
-    
-    # TOILET WALLS
-    # Master toilet walls
-    master_toilet_wall1 = create_wall_with_opening(
-        "Master_Toilet_Wall1",
-        (house_width * 0.15, wall_thickness * 0.7, wall_height),
-        (-house_width * 0.27, house_length * 0.35, wall_height/2),
-        (-house_width * 0.25, house_length * 0.35 + 0.05, 1.0),  # Toilet door
-        (0.6, wall_thickness + 0.1, 2.0)
-    )
-    walls.append(master_toilet_wall1)
-    
-    master_toilet_wall2 = create_wall_with_opening(
-        "Master_Toilet_Wall2",
-        (wall_thickness * 0.7, house_length * 0.2, wall_height),
-        (-house_width * 0.35, house_length * 0.4, wall_height/2)
-    )
-    walls.append(master_toilet_wall2)
-    
-    # Common toilet walls
-    common_toilet_wall1 = create_wall_with_opening(
-        "Common_Toilet_Wall1",
-        (house_width * 0.15, wall_thickness * 0.7, wall_height),
-        (-house_width * 0.27, -house_length * 0.3, wall_height/2),
-        (-house_width * 0.25, -house_length * 0.3 + 0.05, 1.0),  # Toilet door
-        (0.6, wall_thickness + 0.1, 2.0)
-    )
-    walls.append(common_toilet_wall1)
+        # TOILET WALLS
+        ("Master_Toilet_Wall1", (hw * 0.15, iwt, wh), (-hw * 0.27, hl * 0.35, wh/2),
+         [((-hw * 0.25, hl * 0.35 + 0.05, 1.0), (0.6, wt + 0.1, 2.0))]),
+        ("Master_Toilet_Wall2", (iwt, hl * 0.2, wh), (-hw * 0.35, hl * 0.4, wh/2), []),
+        ("Common_Toilet_Wall1", (hw * 0.15, iwt, wh), (-hw * 0.27, -hl * 0.3, wh/2),
+         [((-hw * 0.25, -hl * 0.3 + 0.05, 1.0), (0.6, wt + 0.1, 2.0))]),
+        ("Common_Toilet_Wall2", (iwt, hl * 0.18, wh), (-hw * 0.35, -hl * 0.36, wh/2), []),
+    ]
+
+# House width, length, wall height and exterior wall thickness (230mm standard), in meters
+_HOUSE_DIMENSIONS = (9.0, 11.0, 3.0, 0.23)
+
+def compute_wall_meshdata():
+    """Geometry of every wall, computed without touching bpy"""
+    return [_wall_meshdata(*row) for row in _wall_spec(*_HOUSE_DIMENSIONS)]
+
+def create_2bhk_structure(wall_data=None):
+    """Create the main structure of 2BHK house, optionally from precomputed wall geometry"""
+    house_width, house_length, wall_height, _ = _HOUSE_DIMENSIONS
+    if wall_data is None:
+        wall_data = compute_wall_meshdata()
     
-    common_toilet_wall2 = create_wall_with_opening(
-        "Common_Toilet_Wall2",
-        (wall_thickness * 0.7, house_length * 0.18, wall_height),
-        (-house_width * 0.35, -house_length * 0.36, wall_height/2)
-    )
-    walls.append(common_toilet_wall2)
+    walls = [_wall_object(*row) for row in wall_data]
+    _link_objects(walls)
     
     return walls, house_width, house_length, wall_height
 
-def create_realistic_floors():
-    """Create detailed floor sections for each room"""
-    floors = []
-    
-    # Living room floor (Premium marble)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    living_floor = bpy.context.active_object
-    living_floor.name = "Living_Room_Floor"
-    living_floor.scale = (4.2, 5.0, 0.05)
-    living_floor.location = (2.6, -1.0, 0.025)
-    floors.append(living_floor)
-    
-    # Master bedroom floor (Engineered wood)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    master_floor = bpy.context.active_object
-    master_floor.name = "Master_Bedroom_Floor"
-    master_floor.scale = (3.1, 3.0, 0.05)
-    master_floor.location = (-2.7, 3.5, 0.025)
-    floors.append(master_floor)
-    
-    # Second bedroom floor (Laminate wood)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    bedroom2_floor = bpy.context.active_object
-    bedroom2_floor.name = "Bedroom2_Floor"
-    bedroom2_floor.scale = (3.1, 2.5, 0.05)
-    bedroom2_floor.location = (-2.7, -0.75, 0.025)
-    floors.append(bedroom2_floor)
-    
-    # Kitchen floor (Anti-slip ceramic tiles)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    kitchen_floor = bpy.context.active_object
-    kitchen_floor.name = "Kitchen_Floor"
-    kitchen_floor.scale = (2.8, 4.0, 0.05)
-    kitchen_floor.location = (3.6, 3.5, 0.025)
-    floors.append(kitchen_floor)
-    
-    # Corridor floor (Vitrified tiles)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    corridor_floor = bpy.context.active_object
-    corridor_floor.name = "Corridor_Floor"
-    corridor_floor.scale = (1.2, 8.0, 0.05)
-    corridor_floor.location = (1.35, 0.5, 0.025)
-    floors.append(corridor_floor)
-    
-    # Master toilet floor (Non-slip ceramic)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    master_toilet_floor = bpy.context.active_object
-    master_toilet_floor.name = "Master_Toilet_Floor"
-    master_toilet_floor.scale = (1.3, 2.0, 0.05)
-    master_toilet_floor.location = (-3.65, 4.5, 0.025)
-    floors.append(master_toilet_floor)
-    
-    # Common toilet floor
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    common_toilet_floor = bpy.context.active_object
-    common_toilet_floor.name = "Common_Toilet_Floor"
-    common_toilet_floor.scale = (1.3, 1.8, 0.05)
-    common_toilet_floor.location = (-3.65, -3.6, 0.025)
-    floors.append(common_toilet_floor)
-    
-    return floors
-
-def create_ceiling():
-    """Create ceiling with proper height"""
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    ceiling = bpy.context.active_object
-    ceiling.name = "Main_Ceiling"
-    ceiling.scale = (9.2, 11.2, 0.1)
-    ceiling.location = (0, 0, 3.05)
-    return ceiling
+# Floor slabs per room plus the ceiling as (name, material, scale, location); the material
+# picks the face slot, and the ceiling slot is left empty
+_SLAB_MATERIALS = ('marble', 'wood_floor', 'ceramic_tile', 'ceiling')
+_SLABS = [
+    ("Living_Room", 'marble', (4.2, 5.0, 0.05), (2.6, -1.0, 0.025)),
+    ("Master_Bedroom", 'wood_floor', (3.1, 3.0, 0.05), (-2.7, 3.5, 0.025)),
+    ("Bedroom2", 'wood_floor', (3.1, 2.5, 0.05), (-2.7, -0.75, 0.025)),
+    ("Kitchen", 'ceramic_tile', (2.8, 4.0, 0.05), (3.6, 3.5, 0.025)),
+    ("Corridor", 'ceramic_tile', (1.2, 8.0, 0.05), (1.35, 0.5, 0.025)),
+    ("Master_Toilet", 'ceramic_tile', (1.3, 2.0, 0.05), (-3.65, 4.5, 0.025)),
+    ("Common_Toilet", 'ceramic_tile', (1.3, 1.8, 0.05), (-3.65, -3.6, 0.025)),
+    ("Main_Ceiling", 'ceiling', (9.2, 11.2, 0.1), (0, 0, 3.05)),
+]
+
+def compute_slab_meshdata():
+    """Geometry of the joined floor/ceiling mesh, computed without touching bpy"""
+    return _box_batch_geometry(
+        [scale for _, _, scale, _ in _SLABS],
+        [location for _, _, _, location in _SLABS],
+        [_SLAB_MATERIALS.index(material) for _, material, _, _ in _SLABS],
+    )
+
+def create_floors_and_ceiling(slab_data=None):
+    """Create every room floor and the ceiling as one mesh with a material slot per finish"""
+    if slab_data is None:
+        slab_data = compute_slab_meshdata()
+    slabs = _build_box_batch("Floors_And_Ceiling", slab_data, len(_SLAB_MATERIALS))
+    _link_objects([slabs])
+    return slabs
+
+@njit
+def derive_glass(scales):
+    """Inset glass scales for (N, 3) window frame scales: thinned across the wall, shrunk along it"""
+    glass = np.empty_like(scales)
+    for i in range(scales.shape[0]):
+        if scales[i, 0] < scales[i, 1]:  # Vertical window
+            glass[i, 0] = scales[i, 0] * 0.3
+            glass[i, 1] = scales[i, 1] * 0.9
+        else:  # Horizontal window
+            glass[i, 0] = scales[i, 0] * 0.9
+            glass[i, 1] = scales[i, 1] * 0.3
+        glass[i, 2] = scales[i, 2] * 0.9
+    return glass
 
 def create_premium_doors_windows():
     """Create realistic doors and windows with proper hardware"""
     elements = []
     
     # MAIN ENTRANCE DOOR (Premium wooden door)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    main_door = bpy.context.active_object
-    main_door.name = "Main_Entrance_Door"
-    main_door.scale = (0.9, 0.08, 2.1)
-    main_door.location = (2.0, -5.44, 1.05)
-    elements.append(main_door)
+    main_door = _spawn_cube("Main_Entrance_Door", (0.9, 0.08, 2.1), (2.0, -5.44, 1.05))
+    loose = [main_door]
     
     # Door handle
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.02, depth=0.15)
-    door_handle = bpy.context.active_object
-    door_handle.name = "Main_Door_Handle"
-    door_handle.rotation_euler = (0, math.radians(90), 0)
-    door_handle.location = (2.35, -5.35, 1.0)
-    elements.append(door_handle)
+    door_handle = _spawn_cylinder("Main_Door_Handle", 0.02, 0.15, (2.35, -5.35, 1.0),
+                                  _HANDLE_ROTATION)
+    loose.append(door_handle)
     
     # INTERIOR DOORS
     door_positions = [
@@ -380,27 +595,26 @@ def create_premium_doors_windows():
         ("Common_Toilet_Door", (-3.25, -2.95, 1.0))
     ]
     
-    for door_name, pos in door_positions:
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        door = bpy.context.active_object
-        door.name = door_name
-        if "Toilet" in door_name:
-            door.scale = (0.6, 0.06, 2.0)
-        else:
-            door.scale = (0.8, 0.06, 2.0)
-        door.location = pos
-        elements.append(door)
-        
-        # Door handle
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.015, depth=0.1)
-        handle = bpy.context.active_object
-        handle.name = f"{door_name}_Handle"
-        handle.rotation_euler = (0, math.radians(90), 0)
-        handle_pos = list(pos)
-        handle_pos[0] += 0.25
-        handle_pos[1] += 0.08
-        handle.location = handle_pos
-        elements.append(handle)
+    # Interior doors and their handles go into their own collections, and all of their
+    # transforms are written in one call per property
+    new_object = bpy.data.objects.new
+    cube = _primitive_mesh('cube')
+    cylinder = _primitive_mesh('cylinder')
+    door_names = [door_name for door_name, _ in door_positions]
+    positions = np.array([pos for _, pos in door_positions], dtype=np.float32)
+    door_scales = [(0.6 if "Toilet" in door_name else 0.8, 0.06, 2.0) for door_name in door_names]
+    
+    doors = [new_object(door_name, cube) for door_name in door_names]
+    _populate_collection("Doors", doors, location=positions, scale=door_scales)
+    elements.extend(doors)
+    
+    # Door handles
+    handles = [new_object(f"{door_name}_Handle", cylinder) for door_name in door_names]
+    _populate_collection("Door_Handles", handles,
+                         location=positions + (0.25, 0.08, 0.0),
+                         scale=np.tile((0.015, 0.015, 0.1), (len(handles), 1)),
+                         rotation_euler=np.tile(_HANDLE_ROTATION, (len(handles), 1)))
+    elements.extend(handles)
     
     # WINDOWS WITH FRAMES
     window_data = [
@@ -410,304 +624,103 @@ def create_premium_doors_windows():
         ("Kitchen_Window", (3.0, 5.44, 1.5), (1.5, 0.1, 1.2))
     ]
     
-    for window_name, pos, scale in window_data:
+    # Window glass (slightly inset), derived for all windows at once
+    glass_scales = derive_glass(np.array([scale for _, _, scale in window_data], dtype=np.float64))
+    
+    for (window_name, pos, scale), glass_scale in zip(window_data, glass_scales):
         # Window frame
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        window_frame = bpy.context.active_object
-        window_frame.name = f"{window_name}_Frame"
-        window_frame.scale = scale
-        window_frame.location = pos
-        elements.append(window_frame)
+        window_frame = _spawn(f"{window_name}_Frame", cube, scale, pos)
+        loose.append(window_frame)
         
-        # Window glass (slightly inset)
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        window_glass = bpy.context.active_object
-        window_glass.name = f"{window_name}_Glass"
-        glass_scale = list(scale)
-        glass_pos = list(pos)
-        if scale[0] < scale[1]:  # Vertical window
-            glass_scale[0] = scale[0] * 0.3
-            glass_scale[1] = scale[1] * 0.9
-        else:  # Horizontal window
-            glass_scale[0] = scale[0] * 0.9
-            glass_scale[1] = scale[1] * 0.3
-        glass_scale[2] = scale[2] * 0.9
-        window_glass.scale = glass_scale
-        window_glass.location = glass_pos
-        elements.append(window_glass)
+        window_glass = _spawn(f"{window_name}_Glass", cube, glass_scale, pos)
+        loose.append(window_glass)
     
+    # Everything not placed in the door collections goes to the active collection at once
+    _link_objects(loose)
+    elements.extend(loose)
     return elements
 
-def create_luxury_furniture():
-    """Create high-quality furniture with realistic proportions"""
-    furniture = []
-    
-    # LIVING ROOM FURNITURE SET
-    # Premium L-shaped sectional sofa
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    sofa_main = bpy.context.active_object
-    sofa_main.name = "Sectional_Sofa_Main"
-    sofa_main.scale = (2.8, 0.9, 0.45)
-    sofa_main.location = (3.2, 0.5, 0.225)
-    furniture.append(sofa_main)
-    
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    sofa_chaise = bpy.context.active_object
-    sofa_chaise.name = "Sectional_Sofa_Chaise"
-    sofa_chaise.scale = (0.9, 1.6, 0.45)
-    sofa_chaise.location = (4.5, 1.7, 0.225)
-    furniture.append(sofa_chaise)
+# Single-piece furniture as (sx, sy, sz, lx, ly, lz, mesh_id) rows; mesh_id indexes
+# _PRIMITIVE_KINDS and cylinders use (radius, radius, depth) as their scale
+_FURNITURE_PIECES = [
+    # Living room: L-shaped sectional sofa, coffee table, entertainment center
+    ("Sectional_Sofa_Main",     (2.8, 0.9, 0.45, 3.2, 0.5, 0.225, 0)),
+    ("Sectional_Sofa_Chaise",   (0.9, 1.6, 0.45, 4.5, 1.7, 0.225, 0)),
+    ("Coffee_Table_Base",       (1.2, 0.6, 0.12, 3.2, -0.8, 0.06, 0)),
+    ("Coffee_Table_Glass",      (1.4, 0.8, 0.02, 3.2, -0.8, 0.21, 0)),
+    ("Entertainment_Center",    (2.2, 0.4, 0.6, 3.2, -2.8, 0.3, 0)),
+    ("TV_Screen",               (1.2, 0.05, 0.7, 3.2, -2.5, 1.2, 0)),
+    # Master bedroom: king size bed with headboard, 3-door wardrobe
+    ("Master_Bed_Mattress",     (1.8, 2.0, 0.25, -3.2, 3.8, 0.125, 0)),
+    ("Master_Bed_Headboard",    (1.9, 0.1, 1.2, -3.2, 4.85, 0.6, 0)),
+    ("Master_Wardrobe",         (2.2, 0.6, 2.4, -1.9, 4.7, 1.2, 0)),
+    # Bedroom 2: single bed, study desk and office chair
+    ("Bedroom2_Bed_Mattress",   (1.2, 2.0, 0.25, -3.5, -0.5, 0.125, 0)),
+    ("Study_Desk",              (1.4, 0.7, 0.35, -2.0, -0.5, 0.175, 0)),
+    ("Office_Chair_Seat",       (0.25, 0.25, 0.08, -2.0, 0.0, 0.45, 1)),
+    ("Office_Chair_Back",       (0.4, 0.05, 0.5, -2.0, -0.15, 0.65, 0)),
+    # Kitchen: cabinets, countertop, appliances and dining table
+    ("Kitchen_Lower_Cabinets",  (2.5, 0.6, 0.9, 3.8, 4.8, 0.45, 0)),
+    ("Kitchen_Upper_Cabinets",  (2.5, 0.4, 0.7, 3.8, 4.9, 2.3, 0)),
+    ("Kitchen_Countertop",      (2.6, 0.65, 0.05, 3.8, 4.8, 0.925, 0)),
+    ("Refrigerator",            (0.6, 0.6, 1.8, 2.8, 4.8, 0.9, 0)),
+    ("Kitchen_Stove",           (0.6, 0.6, 0.1, 4.2, 4.8, 0.975, 0)),
+    ("Kitchen_Sink",            (0.6, 0.4, 0.15, 3.4, 4.8, 0.95, 0)),
+    ("Dining_Table",            (0.8, 0.8, 0.05, 2.5, 2.5, 0.75, 1)),
+    # Bathrooms: toilets, wash basins and shower area
+    ("Master_Toilet",           (0.2, 0.2, 0.4, -3.8, 4.0, 0.2, 1)),
+    ("Master_Wash_Basin",       (0.25, 0.25, 0.1, -3.5, 4.8, 0.85, 1)),
+    ("Master_Shower_Area",      (0.9, 0.9, 0.05, -4.0, 5.0, 0.025, 0)),
+    ("Common_Toilet",           (0.18, 0.18, 0.4, -3.8, -3.8, 0.2, 1)),
+    ("Common_Wash_Basin",       (0.22, 0.22, 0.1, -3.5, -3.2, 0.85, 1)),
+]
+_FURNITURE_NAMES = [name for name, _ in _FURNITURE_PIECES]
+_FURNITURE_TABLE = np.array([row for _, row in _FURNITURE_PIECES])
+
+def _build_furniture_spec():
+    """Expand the repeated furniture pieces into (name, kind, scale, location, rotation) rows"""
+    spec = []
     
     # Sofa back cushions
     cushion_positions = [(2.5, 0.5, 0.6), (3.2, 0.5, 0.6), (3.9, 0.5, 0.6), (4.5, 1.2, 0.6)]
-    for i, pos in enumerate(cushion_positions):
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        cushion = bpy.context.active_object
-        cushion.name = f"Sofa_Cushion_{i+1}"
-        cushion.scale = (0.35, 0.15, 0.25)
-        cushion.location = pos
-        furniture.append(cushion)
-    
-    # Premium coffee table with glass top
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    coffee_table_base = bpy.context.active_object
-    coffee_table_base.name = "Coffee_Table_Base"
-    coffee_table_base.scale = (1.2, 0.6, 0.12)
-    coffee_table_base.location = (3.2, -0.8, 0.06)
-    furniture.append(coffee_table_base)
-    
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    coffee_table_top = bpy.context.active_object
-    coffee_table_top.name = "Coffee_Table_Glass"
-    coffee_table_top.scale = (1.4, 0.8, 0.02)
-    coffee_table_top.location = (3.2, -0.8, 0.21)
-    furniture.append(coffee_table_top)
-    
-    # Entertainment center
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    tv_unit = bpy.context.active_object
-    tv_unit.name = "Entertainment_Center"
-    tv_unit.scale = (2.2, 0.4, 0.6)
-    tv_unit.location = (3.2, -2.8, 0.3)
-    furniture.append(tv_unit)
-    
-    # Flat screen TV
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    tv_screen = bpy.context.active_object
-    tv_screen.name = "TV_Screen"
-    tv_screen.scale = (1.2, 0.05, 0.7)
-    tv_screen.location = (3.2, -2.5, 1.2)
-    furniture.append(tv_screen)
-    
-    # MASTER BEDROOM FURNITURE
-    # King size bed with headboard
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    master_bed_mattress = bpy.context.active_object
-    master_bed_mattress.name = "Master_Bed_Mattress"
-    master_bed_mattress.scale = (1.8, 2.0, 0.25)
-    master_bed_mattress.location = (-3.2, 3.8, 0.125)
-    furniture.append(master_bed_mattress)
-    
-    # Bed headboard
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    headboard = bpy.context.active_object
-    headboard.name = "Master_Bed_Headboard"
-    headboard.scale = (1.9, 0.1, 1.2)
-    headboard.location = (-3.2, 4.85, 0.6)
-    furniture.append(headboard)
-    
-    # Wardrobe (3-door)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    wardrobe = bpy.context.active_object
-    wardrobe.name = "Master_Wardrobe"
-    wardrobe.scale = (2.2, 0.6, 2.4)
-    wardrobe.location = (-1.9, 4.7, 1.2)
-    furniture.append(wardrobe)
+    spec += [(f"Sofa_Cushion_{i+1}", 'cube', (0.35, 0.15, 0.25), pos, None)
+             for i, pos in enumerate(cushion_positions)]
     
     # Wardrobe handles
-    for i in range(3):
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.01, depth=0.08)
-        handle = bpy.context.active_object
-        handle.name = f"Wardrobe_Handle_{i+1}"
-        handle.rotation_euler = (0, math.radians(90), 0)
-        handle.location = (-1.4 + (i * 0.7), 4.4, 1.2)
-        furniture.append(handle)
-    
-    # Bedside tables with drawers
+    spec += [(f"Wardrobe_Handle_{i+1}", 'cylinder', (0.01, 0.01, 0.08),
+              (-1.4 + (i * 0.7), 4.4, 1.2), _HANDLE_ROTATION)
+             for i in range(3)]
+    
+    # Bedside tables with drawers and table lamps
     bedside_positions = [(-4.2, 3.8, 0.3), (-2.2, 3.8, 0.3)]
-    for i, pos in enumerate(bedside_positions):
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        bedside = bpy.context.active_object
-        bedside.name = f"Bedside_Table_{i+1}"
-        bedside.scale = (0.45, 0.4, 0.6)
-        bedside.location = pos
-        furniture.append(bedside)
-        
-        # Table lamps
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.15, depth=0.3)
-        lamp = bpy.context.active_object
-        lamp.name = f"Table_Lamp_{i+1}"
-        lamp_pos = list(pos)
-        lamp_pos[2] = 0.75
-        lamp.location = lamp_pos
-        furniture.append(lamp)
-    
-    # BEDROOM 2 FURNITURE
-    # Single bed with storage
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    bed2_mattress = bpy.context.active_object
-    bed2_mattress.name = "Bedroom2_Bed_Mattress"
-    bed2_mattress.scale = (1.2, 2.0, 0.25)
-    bed2_mattress.location = (-3.5, -0.5, 0.125)
-    furniture.append(bed2_mattress)
-    
-    # Study desk with drawers
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    study_desk = bpy.context.active_object
-    study_desk.name = "Study_Desk"
-    study_desk.scale = (1.4, 0.7, 0.35)
-    study_desk.location = (-2.0, -0.5, 0.175)
-    furniture.append(study_desk)
-    
-    # Office chair
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.25, depth=0.08)
-    chair_seat = bpy.context.active_object
-    chair_seat.name = "Office_Chair_Seat"
-    chair_seat.location = (-2.0, 0.0, 0.45)
-    furniture.append(chair_seat)
-    
-    # Chair backrest
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    chair_back = bpy.context.active_object
-    chair_back.name = "Office_Chair_Back"
-    chair_back.scale = (0.4, 0.05, 0.5)
-    chair_back.location = (-2.0, -0.15, 0.65)
-    furniture.append(chair_back)
-    
-    # KITCHEN FURNITURE
-    # Kitchen cabinets (lower)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    lower_cabinets = bpy.context.active_object
-    lower_cabinets.name = "Kitchen_Lower_Cabinets"
-    lower_cabinets.scale = (2.5, 0.6, 0.9)
-    lower_cabinets.location = (3.8, 4.8, 0.45)
-    furniture.append(lower_cabinets)
-    
-    # Kitchen cabinets (upper)
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    upper_cabinets = bpy.context.active_object
-    upper_cabinets.name = "Kitchen_Upper_Cabinets"
-    upper_cabinets.scale = (2.5, 0.4, 0.7)
-    upper_cabinets.location = (3.8, 4.9, 2.3)
-    furniture.append(upper_cabinets)
-    
-    # Kitchen countertop
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    countertop = bpy.context.active_object
-    countertop.name = "Kitchen_Countertop"
-    countertop.scale = (2.6, 0.65, 0.05)
-    countertop.location = (3.8, 4.8, 0.925)
-    furniture.append(countertop)
-    
-    # Refrigerator
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    refrigerator = bpy.context.active_object
-    refrigerator.name = "Refrigerator"
-    refrigerator.scale = (0.6, 0.6, 1.8)
-    refrigerator.location = (2.8, 4.8, 0.9)
-    furniture.append(refrigerator)
-    
-    # Stove/Cooktop
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    stove = bpy.context.active_object
-    stove.name = "Kitchen_Stove"
-    stove.scale = (0.6, 0.6, 0.1)
-    stove.location = (4.2, 4.8, 0.975)
-    furniture.append(stove)
-    
-    # Kitchen sink
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    sink = bpy.context.active_object
-    sink.name = "Kitchen_Sink"
-    sink.scale = (0.6, 0.4, 0.15)
-    sink.location = (3.4, 4.8, 0.95)
-    furniture.append(sink)
-    
-    # Dining table
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.8, depth=0.05)
-    dining_table = bpy.context.active_object
-    dining_table.name = "Dining_Table"
-    dining_table.location = (2.5, 2.5, 0.75)
-    furniture.append(dining_table)
-    
-    # Dining chairs
+    for i, (x, y, z) in enumerate(bedside_positions):
+        spec.append((f"Bedside_Table_{i+1}", 'cube', (0.45, 0.4, 0.6), (x, y, z), None))
+        spec.append((f"Table_Lamp_{i+1}", 'cylinder', (0.15, 0.15, 0.3), (x, y, 0.75), None))
+    
+    # Dining chairs, each with a backrest on the side away from the table
     chair_positions_dining = [
         (1.8, 2.5, 0.4), (3.2, 2.5, 0.4), (2.5, 1.8, 0.4), (2.5, 3.2, 0.4)
     ]
-    for i, pos in enumerate(chair_positions_dining):
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=0.06)
-        dining_chair = bpy.context.active_object
-        dining_chair.name = f"Dining_Chair_{i+1}"
-        dining_chair.location = pos
-        furniture.append(dining_chair)
-        
-        # Chair backrest
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        chair_back = bpy.context.active_object
-        chair_back.name = f"Dining_Chair_Back_{i+1}"
-        chair_back.scale = (0.3, 0.03, 0.4)
-        back_pos = list(pos)
-        back_pos[2] = 0.7
-        if i == 0:
-            back_pos[1] -= 0.15
-        elif i == 1:
-            back_pos[1] += 0.15
-        elif i == 2:
-            back_pos[0] -= 0.15
-        else:
-            back_pos[0] += 0.15
-        chair_back.location = back_pos
-        furniture.append(chair_back)
-    
-    # BATHROOM FIXTURES
-    # Master bathroom fixtures
-    # Toilet
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=0.4)
-    master_toilet = bpy.context.active_object
-    master_toilet.name = "Master_Toilet"
-    master_toilet.location = (-3.8, 4.0, 0.2)
-    furniture.append(master_toilet)
-    
-    # Wash basin
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.25, depth=0.1)
-    master_basin = bpy.context.active_object
-    master_basin.name = "Master_Wash_Basin"
-    master_basin.location = (-3.5, 4.8, 0.85)
-    furniture.append(master_basin)
-    
-    # Shower area
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    master_shower = bpy.context.active_object
-    master_shower.name = "Master_Shower_Area"
-    master_shower.scale = (0.9, 0.9, 0.05)
-    master_shower.location = (-4.0, 5.0, 0.025)
-    furniture.append(master_shower)
-    
-    # Common bathroom fixtures
-    # Toilet
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.18, depth=0.4)
-    common_toilet = bpy.context.active_object
-    common_toilet.name = "Common_Toilet"
-    common_toilet.location = (-3.8, -3.8, 0.2)
-    furniture.append(common_toilet)
-    
-    # Wash basin
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.22, depth=0.1)
-    common_basin = bpy.context.active_object
-    common_basin.name = "Common_Wash_Basin"
-    common_basin.location = (-3.5, -3.2, 0.85)
-    furniture.append(common_basin)
+    back_offsets = [(0, -0.15), (0, 0.15), (-0.15, 0), (0.15, 0)]
+    for i, ((x, y, z), (dx, dy)) in enumerate(zip(chair_positions_dining, back_offsets)):
+        spec.append((f"Dining_Chair_{i+1}", 'cylinder', (0.2, 0.2, 0.06), (x, y, z), None))
+        spec.append((f"Dining_Chair_Back_{i+1}", 'cube', (0.3, 0.03, 0.4), (x + dx, y + dy, 0.7), None))
+    
+    return spec
+
+_FURNITURE_SPEC = _build_furniture_spec()
+
+def create_luxury_furniture():
+    """Create high-quality furniture with realistic proportions"""
+    meshes = [_primitive_mesh(kind) for kind in _PRIMITIVE_KINDS]
+    furniture = [_spawn(name, meshes[int(row[6])], row[0:3], row[3:6])
+                 for name, row in zip(_FURNITURE_NAMES, _FURNITURE_TABLE)]
     
+    # Repeated pieces (cushions, handles, bedside sets, dining chairs)
+    furniture.extend(_spawn(name, meshes[_PRIMITIVE_KINDS.index(kind)], scale, location, rotation)
+                     for name, kind, scale, location, rotation in _FURNITURE_SPEC)
+    
+    _link_objects(furniture)
     return furniture
 
 def create_bathroom_fixtures():
@@ -715,37 +728,22 @@ def create_bathroom_fixtures():
     fixtures = []
     
     # Master bathroom vanity
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    master_vanity = bpy.context.active_object
-    master_vanity.name = "Master_Bathroom_Vanity"
-    master_vanity.scale = (1.0, 0.5, 0.8)
-    master_vanity.location = (-3.5, 4.6, 0.4)
+    master_vanity = _spawn_cube("Master_Bathroom_Vanity", (1.0, 0.5, 0.8), (-3.5, 4.6, 0.4))
     fixtures.append(master_vanity)
     
     # Master bathroom mirror
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    master_mirror = bpy.context.active_object
-    master_mirror.name = "Master_Bathroom_Mirror"
-    master_mirror.scale = (0.8, 0.02, 0.6)
-    master_mirror.location = (-3.5, 4.4, 1.5)
+    master_mirror = _spawn_cube("Master_Bathroom_Mirror", (0.8, 0.02, 0.6), (-3.5, 4.4, 1.5))
     fixtures.append(master_mirror)
     
     # Common bathroom vanity
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    common_vanity = bpy.context.active_object
-    common_vanity.name = "Common_Bathroom_Vanity"
-    common_vanity.scale = (0.9, 0.45, 0.75)
-    common_vanity.location = (-3.5, -3.4, 0.375)
+    common_vanity = _spawn_cube("Common_Bathroom_Vanity", (0.9, 0.45, 0.75), (-3.5, -3.4, 0.375))
     fixtures.append(common_vanity)
     
     # Common bathroom mirror
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    common_mirror = bpy.context.active_object
-    common_mirror.name = "Common_Bathroom_Mirror"
-    common_mirror.scale = (0.7, 0.02, 0.5)
-    common_mirror.location = (-3.5, -3.2, 1.4)
+    common_mirror = _spawn_cube("Common_Bathroom_Mirror", (0.7, 0.02, 0.5), (-3.5, -3.2, 1.4))
     fixtures.append(common_mirror)
     
+    _link_objects(fixtures)
     return fixtures
 
 def create_lighting():
@@ -763,29 +761,35 @@ def create_lighting():
         ("Common_Toilet_Light", (-3.5, -3.6, 2.8))
     ]
     
-    for light_name, pos in light_positions:
-        bpy.ops.object.light_add(type='AREA', location=pos)
-        light = bpy.context.active_object
-        light.name = light_name
-        light.data.energy = 100
-        light.data.size = 0.5
-        lights.append(light)
-        
-        # Light fixture
-        bpy.ops.mesh.primitive_cylinder_add(radius=0.2, depth=0.1, location=pos)
-        fixture = bpy.context.active_object
-        fixture.name = f"{light_name}_Fixture"
-        fixture_pos = list(pos)
-        fixture_pos[2] -= 0.1
-        fixture.location = fixture_pos
-        lights.append(fixture)
+    # All ceiling lights are identical, so they share one light datablock
+    ceiling_light = bpy.data.lights.new("Ceiling_Light", type='AREA')
+    ceiling_light.energy = 100
+    ceiling_light.size = 0.5
+    
+    # Lights and their fixtures each live in one collection, placed with one foreach_set
+    new_object = bpy.data.objects.new
+    cylinder = _primitive_mesh('cylinder')
+    light_names = [light_name for light_name, _ in light_positions]
+    positions = np.array([pos for _, pos in light_positions], dtype=np.float32)
+    
+    ceiling_lights = [new_object(light_name, ceiling_light) for light_name in light_names]
+    _populate_collection("Lights", ceiling_lights, location=positions)
+    lights.extend(ceiling_lights)
+    
+    # Light fixtures
+    fixtures = [new_object(f"{light_name}_Fixture", cylinder) for light_name in light_names]
+    _populate_collection("Light_Fixtures", fixtures,
+                         location=positions - (0.0, 0.0, 0.1),
+                         scale=np.tile((0.2, 0.2, 0.1), (len(fixtures), 1)))
+    lights.extend(fixtures)
     
     # Add sun lamp for overall lighting
-    bpy.ops.object.light_add(type='SUN', location=(0, 0, 10))
-    sun = bpy.context.active_object
-    sun.name = "Sun_Light"
-    sun.data.energy = 3
-    sun.rotation_euler = (math.radians(60), 0, math.radians(45))
+    sun_data = bpy.data.lights.new("Sun_Light", type='SUN')
+    sun_data.energy = 3
+    sun = bpy.data.objects.new("Sun_Light", sun_data)
+    sun.location = (0, 0, 10)
+    sun.rotation_euler = _SUN_ROTATION
+    _link_objects([sun])
     lights.append(sun)
     
     return lights
@@ -793,126 +797,220 @@ def create_lighting():
 def apply_materials_to_objects():
     """Apply realistic materials to all objects"""
     
-    # Create materials
-    brick_material = create_advanced_material("Brick_Wall", (0.6, 0.4, 0.3), 0.8, 0.0, 'brick_wall')
-    wood_floor_material = create_advanced_material("Wood_Floor", (0.4, 0.25, 0.15), 0.3, 0.0, 'wood_floor')
-    ceramic_material = create_advanced_material("Ceramic_Tile", (0.9, 0.9, 0.85), 0.1, 0.0, 'ceramic_tile')
-    marble_material = create_advanced_material("Marble_Floor", (0.95, 0.95, 0.9), 0.05, 0.0, 'marble')
-    glass_material = create_advanced_material("Glass", (0.8, 0.9, 1.0), 0.0, 0.0, 'glass')
-    metal_material = create_advanced_material("Metal", (0.7, 0.7, 0.7), 0.2, 1.0, 'metal')
-    wood_material = create_advanced_material("Wood_Furniture", (0.5, 0.3, 0.2), 0.6, 0.0)
-    fabric_material = create_advanced_material("Fabric", (0.2, 0.4, 0.7), 0.8, 0.0)
-    
-    # Apply materials to objects
+    # Materials as create_advanced_material arguments; each one is only built once an
+    # object that needs it is found in the scene
+    brick = ("Brick_Wall", (0.6, 0.4, 0.3), 0.8, 0.0, 'brick_wall')
+    wood_floor = ("Wood_Floor", (0.4, 0.25, 0.15), 0.3, 0.0, 'wood_floor')
+    ceramic = ("Ceramic_Tile", (0.9, 0.9, 0.85), 0.1, 0.0, 'ceramic_tile')
+    marble = ("Marble_Floor", (0.95, 0.95, 0.9), 0.05, 0.0, 'marble')
+    glass = ("Glass", (0.8, 0.9, 1.0), 0.0, 0.0, 'glass')
+    metal = ("Metal", (0.7, 0.7, 0.7), 0.2, 1.0, 'metal')
+    wood = ("Wood_Furniture", (0.5, 0.3, 0.2), 0.6, 0.0)
+    fabric = ("Fabric", (0.2, 0.4, 0.7), 0.8, 0.0)
+    
+    # Apply materials to objects; sets give O(1) category membership checks
     material_assignments = {
         # Walls
-        'brick_wall': ['Front_Wall', 'Back_Wall', 'Left_Wall', 'Right_Wall', 'Main_Partition_Wall', 
-                       'Master_Bedroom_Wall', 'Bedroom2_Wall', 'Kitchen_Partition',
-                       'Master_Toilet_Wall1', 'Master_Toilet_Wall2', 'Common_Toilet_Wall1', 'Common_Toilet_Wall2'],
-        
-        # Floors
-        'wood_floor': ['Master_Bedroom_Floor', 'Bedroom2_Floor'],
-        'ceramic_tile': ['Kitchen_Floor', 'Corridor_Floor', 'Master_Toilet_Floor', 'Common_Toilet_Floor'],
-        'marble': ['Living_Room_Floor'],
+        brick: frozenset({'Front_Wall', 'Back_Wall', 'Left_Wall', 'Right_Wall', 'Main_Partition_Wall',
+                          'Master_Bedroom_Wall', 'Bedroom2_Wall', 'Kitchen_Partition',
+                          'Master_Toilet_Wall1', 'Master_Toilet_Wall2', 'Common_Toilet_Wall1', 'Common_Toilet_Wall2'}),
         
         # Windows and glass
-        'glass': ['Living_Room_Window_Glass', 'Master_Bedroom_Window_Glass', 'Bedroom2_Window_Glass',
-                  'Kitchen_Window_Glass', 'Coffee_Table_Glass', 'TV_Screen'],
+        glass: frozenset({'Living_Room_Window_Glass', 'Master_Bedroom_Window_Glass', 'Bedroom2_Window_Glass',
+                          'Kitchen_Window_Glass', 'Coffee_Table_Glass', 'TV_Screen'}),
         
         # Metal fixtures
-        'metal': ['Main_Door_Handle', 'Master_Bedroom_Door_Handle', 'Bedroom2_Door_Handle',
-                  'Kitchen_Door_Handle', 'Master_Toilet_Door_Handle', 'Common_Toilet_Door_Handle',
-                  'Wardrobe_Handle_1', 'Wardrobe_Handle_2', 'Wardrobe_Handle_3', 'Kitchen_Sink', 'Refrigerator'],
+        metal: frozenset({'Main_Door_Handle', 'Master_Bedroom_Door_Handle', 'Bedroom2_Door_Handle',
+                          'Kitchen_Door_Handle', 'Master_Toilet_Door_Handle', 'Common_Toilet_Door_Handle',
+                          'Wardrobe_Handle_1', 'Wardrobe_Handle_2', 'Wardrobe_Handle_3', 'Kitchen_Sink', 'Refrigerator'}),
         
         # Wood furniture
-        'wood_furniture': ['Main_Entrance_Door', 'Master_Bedroom_Door', 'Bedroom2_Door', 'Kitchen_Door',
-                          'Master_Toilet_Door', 'Common_Toilet_Door', 'Coffee_Table_Base', 'Entertainment_Center',
-                          'Master_Bed_Headboard', 'Master_Wardrobe', 'Bedside_Table_1', 'Bedside_Table_2',
-                          'Study_Desk', 'Kitchen_Lower_Cabinets', 'Kitchen_Upper_Cabinets', 'Dining_Table'],
+        wood: frozenset({'Main_Entrance_Door', 'Master_Bedroom_Door', 'Bedroom2_Door', 'Kitchen_Door',
+                         'Master_Toilet_Door', 'Common_Toilet_Door', 'Coffee_Table_Base', 'Entertainment_Center',
+                         'Master_Bed_Headboard', 'Master_Wardrobe', 'Bedside_Table_1', 'Bedside_Table_2',
+                         'Study_Desk', 'Kitchen_Lower_Cabinets', 'Kitchen_Upper_Cabinets', 'Dining_Table'}),
         
         # Fabric
-        'fabric': ['Sectional_Sofa_Main', 'Sectional_Sofa_Chaise', 'Master_Bed_Mattress', 'Bedroom2_Bed_Mattress']
-    }
-    
-    materials = {
-        'brick_wall': brick_material,
-        'wood_floor': wood_floor_material,
-        'ceramic_tile': ceramic_material,
-        'marble': marble_material,
-        'glass': glass_material,
-        'metal': metal_material,
-        'wood_furniture': wood_material,
-        'fabric': fabric_material
+        fabric: frozenset({'Sectional_Sofa_Main', 'Sectional_Sofa_Chaise', 'Master_Bed_Mattress', 'Bedroom2_Bed_Mattress'}),
     }
     
-    # Apply materials
-    for material_type, object_names in material_assignments.items():
-        material = materials[material_type]
-        for obj_name in object_names:
-            if obj_name in bpy.data.objects:
-                obj = bpy.data.objects[obj_name]
-                if obj.data.materials:
-                    obj.data.materials[0] = material
-                else:
-                    obj.data.materials.append(material)
+    # Group every (object, slot index) pair by material, resolving objects through the
+    # builders' object cache; the joined floor/ceiling mesh joins in with one slot per finish
+    by_material = defaultdict(list)
+    for material_spec, object_names in material_assignments.items():
+        by_material[material_spec].extend((obj, 0) for obj in map(get_obj, object_names) if obj is not None)
+    slabs = get_obj("Floors_And_Ceiling")
+    if slabs is not None:
+        slab_specs = {'marble': marble, 'wood_floor': wood_floor, 'ceramic_tile': ceramic}
+        for index, material_type in enumerate(_SLAB_MATERIALS):
+            if material_type in slab_specs:
+                by_material[slab_specs[material_type]].append((slabs, index))
+    
+    # Meshes built here always carry their slots; give any other object its slot up front
+    # so the assignment pass below never has to check
+    for pairs in by_material.values():
+        for obj, _ in pairs:
+            if not len(obj.material_slots):
+                obj.data.materials.append(None)
+    
+    # Apply materials, building each one only if something uses it
+    assign = _assign_material
+    for material_spec, pairs in by_material.items():
+        if not pairs:
+            continue
+        material = create_advanced_material(*material_spec)
+        for obj, index in pairs:
+            assign(obj, material, index)
 
-def setup_camera_and_render():
-    """Setup camera for optimal view and render settings"""
+# Cycles GPU backends in order of preference
+_GPU_BACKENDS = ('OPTIX', 'CUDA', 'HIP', 'METAL', 'ONEAPI')
+
+def _select_cycles_device(scene):
+    """Render Cycles on the first available GPU backend, falling back to the CPU"""
+    addon = bpy.context.preferences.addons.get('cycles')
+    if addon is None:
+        scene.cycles.device = 'CPU'
+        return 'CPU'
+    prefs = addon.preferences
+    
+    for device_type in _GPU_BACKENDS:
+        try:
+            prefs.compute_device_type = device_type
+        except TypeError:
+            # Backend not compiled into this Blender build
+            continue
+        if any(device.type != 'CPU' for device in prefs.get_devices_for_type(device_type)):
+            break
+    else:
+        prefs.compute_device_type = 'NONE'
+        scene.cycles.device = 'CPU'
+        return 'CPU'
+    
+    for device in prefs.devices:
+        device.use = device.type != 'CPU'
+    scene.cycles.device = 'GPU'
+    return 'GPU'
+
+def _configure_cycles(scene, samples):
+    """Cycles settings for final renders: GPU device, tiling, adaptive sampling and denoising"""
+    cycles = scene.cycles
+    device = _select_cycles_device(scene)
+    
+    # Big tiles keep the GPU busy; Cycles X (3.0+) renders in auto-sized tiles instead
+    if bpy.app.version >= (3, 0, 0):
+        cycles.use_auto_tile = True
+        cycles.tile_size = 2048
+    else:
+        tile = 256 if device == 'GPU' else 32
+        scene.render.tile_x = tile
+        scene.render.tile_y = tile
+    
+    cycles.samples = samples
+    
+    # Let converged pixels stop early and clean up the remaining noise with the denoiser
+    cycles.use_adaptive_sampling = True
+    cycles.adaptive_threshold = 0.01
+    cycles.adaptive_min_samples = 16
+    cycles.use_denoising = True
+    cycles.denoiser = 'OPENIMAGEDENOISE'
+    
+    # The house is static: keep the BVH and device buffers between renders and spend a
+    # little longer building a spatial-split BVH that traces faster (costs extra memory)
+    scene.render.use_persistent_data = True
+    cycles.debug_use_spatial_splits = True
+
+def _configure_eevee(scene, samples):
+    """EEVEE settings for quick renders, with screen-space reflections and ambient occlusion"""
+    eevee = scene.eevee
+    eevee.taa_render_samples = samples
+    # Blender 4.2 replaced these with ray tracing options
+    if hasattr(eevee, 'use_ssr'):
+        eevee.use_ssr = True
+    if hasattr(eevee, 'use_gtao'):
+        eevee.use_gtao = True
+
+def setup_camera_and_render(resolution=(1920, 1080), samples=None, preview=False, engine='BLENDER_EEVEE'):
+    """Setup camera and render settings; EEVEE for quick renders, CYCLES for final ones (samples: 64 / 128 by default)"""
     
     # Position camera for best overview
-    bpy.ops.object.camera_add(location=(15, -15, 8))
-    camera = bpy.context.active_object
-    camera.name = "House_Camera"
+    camera = bpy.data.objects.new("House_Camera", bpy.data.cameras.new("House_Camera"))
+    camera.location = (15, -15, 8)
     camera.rotation_euler = (math.radians(55), 0, math.radians(45))
+    _link_objects([camera])
     
     # Set camera as active
-    bpy.context.scene.camera = camera
+    scene = bpy.context.scene
+    scene.camera = camera
     
     # Render settings
-    bpy.context.scene.render.engine = 'CYCLES'
-    bpy.context.scene.cycles.samples = 128
-    bpy.context.scene.render.resolution_x = 1920
-    bpy.context.scene.render.resolution_y = 1080
+    if engine == 'CYCLES':
+        scene.render.engine = 'CYCLES'
+        _configure_cycles(scene, samples or 128)
+    else:
+        engines = scene.render.bl_rna.properties['engine'].enum_items.keys()
+        # EEVEE is registered as BLENDER_EEVEE_NEXT in Blender 4.2-4.x
+        scene.render.engine = engine if engine in engines else 'BLENDER_EEVEE_NEXT'
+        _configure_eevee(scene, samples or 64)
+    
+    scene.render.resolution_x, scene.render.resolution_y = resolution
+    scene.render.resolution_percentage = 50 if preview else 100
     
     return camera
 
 def main():
     """Main function to create the complete 2BHK house"""
-    print("Starting 2BHK House Generation...")
+    verbose = os.environ.get('HOUSE_VERBOSE', '1') != '0'
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, format='%(message)s')
+    log.info("Starting 2BHK House Generation...")
     
     # Clear existing scene
     clear_scene()
     
-    print("Creating house structure...")
-    walls, house_width, house_length, wall_height = create_2bhk_structure()
-    
-    print("Creating floors...")
-    floors = create_realistic_floors()
-    
-    print("Creating ceiling...")
-    ceiling = create_ceiling()
-    
-    print("Creating doors and windows...")
-    doors_windows = create_premium_doors_windows()
-    
-    print("Creating furniture...")
-    furniture = create_luxury_furniture()
-    
-    print("Creating bathroom fixtures...")
-    bathroom_fixtures = create_bathroom_fixtures()
-    
-    print("Creating lighting...")
-    lights = create_lighting()
-    
-    print("Applying materials...")
-    apply_materials_to_objects()
-    
-    print("Setting up camera...")
-    camera = setup_camera_and_render()
-    
-    print("2BHK House generation complete!")
-    print(f"Total objects created: {len(bpy.data.objects)}")
-    print("Switch to rendered view to see the final result.")
+    # Keep the interface from redrawing against the scene while it is being rebuilt, and
+    # put the user's (file-saved) setting back afterwards
+    render = bpy.context.scene.render
+    lock_interface = render.use_lock_interface
+    render.use_lock_interface = True
+    try:
+        # The wall and slab geometry is plain Python/NumPy, so it is computed on worker threads
+        # while the main thread creates and links the datablocks, which bpy requires
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            wall_data = pool.submit(compute_wall_meshdata)
+            slab_data = pool.submit(compute_slab_meshdata)
+        
+            log.info("Creating house structure...")
+            walls, house_width, house_length, wall_height = create_2bhk_structure(wall_data.result())
+        
+            log.info("Creating floors and ceiling...")
+            slabs = create_floors_and_ceiling(slab_data.result())
+        
+        log.info("Creating doors and windows...")
+        doors_windows = create_premium_doors_windows()
+        
+        log.info("Creating furniture...")
+        furniture = create_luxury_furniture()
+        
+        log.info("Creating bathroom fixtures...")
+        bathroom_fixtures = create_bathroom_fixtures()
+        
+        log.info("Creating lighting...")
+        lights = create_lighting()
+        
+        log.info("Applying materials...")
+        apply_materials_to_objects()
+        
+        log.info("Setting up camera...")
+        camera = setup_camera_and_render(preview=True)
+        
+        # Every builder links through bpy.data, so nothing is evaluated mid-build; evaluate
+        # the finished scene exactly once
+        bpy.context.view_layer.update()
+    finally:
+        render.use_lock_interface = lock_interface
+    
+    log.info("2BHK House generation complete!")
+    log.info("Total objects created: %d", len(bpy.data.objects))
+    log.info("Switch to rendered view to see the final result.")
 
 # Execute the main function
 if __name__ == "__main__":
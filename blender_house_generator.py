@@ -4,63 +4,208 @@ Ultra-Realistic House Architecture Generator
 Usage: blender -b -P blender_house_generator.py -- --land 7 --orientation North --house_type 3BHK --output test_house.glb --furniture "beds,sofa,dining_table,kitchen_counter"
 """
 
+import argparse
 import bpy
 import sys
 import json
 import math
 import bmesh
+from collections import defaultdict
+import numpy as np
 
-# Get custom arguments after '--'
-argv = sys.argv
-if "--" in argv:
-    argv = argv[argv.index("--") + 1:]
-else:
-    argv = []
+def parse_args(argv=None):
+    """Parse the generator options; by default from the arguments after '--' in sys.argv"""
+    # Get custom arguments after '--'
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--land', type=int, required=True)
+    parser.add_argument('--orientation', type=str, required=True)
+    parser.add_argument('--house_type', type=str, required=True)
+    parser.add_argument('--output', type=str, required=True)
+    parser.add_argument('--format', type=str, choices=['glb', 'obj', 'fbx'], default='glb')
+    parser.add_argument('--kitchen_size', type=str, default='medium')
+    parser.add_argument('--living_room', type=str, default='medium')
+    parser.add_argument('--bathrooms', type=str, default='1')
+    parser.add_argument('--balcony', type=str, default='no')
+    parser.add_argument('--parking', type=str, default='no')
+    parser.add_argument('--garden', type=str, default='no')
+    parser.add_argument('--study_room', type=str, default='no')
+    parser.add_argument('--furniture', type=str, default='')
+    
+    return parser.parse_args(argv)
 
-# Parse arguments
-import argparse
-parser = argparse.ArgumentParser()
-parser.add_argument('--land', type=int, required=True)
-parser.add_argument('--orientation', type=str, required=True)
-parser.add_argument('--house_type', type=str, required=True)
-parser.add_argument('--output', type=str, required=True)
-parser.add_argument('--format', type=str, choices=['glb', 'obj', 'fbx'], default='glb')
-parser.add_argument('--kitchen_size', type=str, default='medium')
-parser.add_argument('--living_room', type=str, default='medium')
-parser.add_argument('--bathrooms', type=str, default='1')
-parser.add_argument('--balcony', type=str, default='no')
-parser.add_argument('--parking', type=str, default='no')
-parser.add_argument('--garden', type=str, default='no')
-parser.add_argument('--study_room', type=str, default='no')
-parser.add_argument('--furniture', type=str, default='')
-
-args = parser.parse_args(argv)
-
-# Parse furniture list
-furniture_list = []
-if args.furniture:
-    furniture_list = [item.strip() for item in args.furniture.split(',')]
-
-print("🏗️ Ultra-Realistic House Architecture Generator")
-print("=" * 60)
-print(f"📏 Land Area: {args.land} cents")
-print(f"🏠 House Type: {args.house_type}")
-print(f" Orientation: {args.orientation}")
-print(f" Kitchen: {args.kitchen_size}")
-print(f"🛋️ Living Room: {args.living_room}")
-print(f" Bathrooms: {args.bathrooms}")
-print(f" Balcony: {args.balcony}")
-print(f"🚗 Parking: {args.parking}")
-print(f"🌱 Garden: {args.garden}")
-print(f"📚 Study Room: {args.study_room}")
-print(f"🪑 Furniture: {furniture_list}")
-
-# Clear existing scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
+def clear_scene():
+    """Remove every object, the data it leaves behind and the caches pointing at that data"""
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    
+    # Drop the meshes, materials, lights and cameras those objects leave behind
+    for datablocks in (bpy.data.meshes, bpy.data.materials, bpy.data.lights, bpy.data.cameras):
+        for block in list(datablocks):
+            if block.users == 0:
+                datablocks.remove(block)
+    
+    _MATERIAL_CACHE.clear()
+    _OPENING_MESHES.clear()
+
+# Collection new objects go into; the house builders look it up once per build
+# rather than per object
+_COLLECTION = None
+
+# Unit cube matching primitive_cube_add(size=1); boxes are this scaled, turned and moved
+_UNIT_CUBE_ARRAY = np.array([
+    (-0.5, -0.5, -0.5), (0.5, -0.5, -0.5), (0.5, 0.5, -0.5), (-0.5, 0.5, -0.5),
+    (-0.5, -0.5, 0.5), (0.5, -0.5, 0.5), (0.5, 0.5, 0.5), (-0.5, 0.5, 0.5),
+], dtype=np.float32)
+_UNIT_CUBE_INDICES = np.array([
+    (0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4),
+    (2, 3, 7, 6), (3, 0, 4, 7), (1, 2, 6, 5),
+], dtype=np.int32)
+
+def _box_geometry(boxes):
+    """Vertices and quads of (x, y, z, sx, sy, sz, angle) box rows stacked into one buffer"""
+    boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 7)
+    
+    # Scale the unit cube per box, turn it about Z, then move it into place
+    corners = _UNIT_CUBE_ARRAY[None, :, :] * boxes[:, None, 3:6]
+    cos = np.cos(boxes[:, 6])[:, None]
+    sin = np.sin(boxes[:, 6])[:, None]
+    verts = np.empty_like(corners)
+    verts[..., 0] = corners[..., 0] * cos - corners[..., 1] * sin
+    verts[..., 1] = corners[..., 0] * sin + corners[..., 1] * cos
+    verts[..., 2] = corners[..., 2]
+    verts += boxes[:, None, :3]
+    faces = _UNIT_CUBE_INDICES[None, :, :] + (np.arange(len(boxes), dtype=np.int32) * 8)[:, None, None]
+    
+    return verts.reshape(-1, 3), faces.reshape(-1, 4)
+
+def _quad_mesh(name, verts, faces, face_materials, materials):
+    """Build a quad mesh with foreach_set, giving each face the slot index of its material"""
+    face_count = len(faces)
+    
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(verts, dtype=np.float32).ravel())
+    mesh.loops.add(face_count * 4)
+    mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(faces, dtype=np.int32).ravel())
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, face_count * 4, 4, dtype=np.int32))
+    mesh.polygons.foreach_set("loop_total", np.full(face_count, 4, dtype=np.int32))
+    mesh.polygons.foreach_set("material_index", np.asarray(face_materials, dtype=np.int32))
+    for material in materials:
+        mesh.materials.append(material)
+    mesh.update(calc_edges=True)
+    
+    return mesh
+
+def _add_object(name, mesh, location=(0, 0, 0)):
+    """Create and link an object for mesh without going through bpy.ops"""
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    _COLLECTION.objects.link(obj)
+    return obj
+
+# Frame + panel meshes for doors and windows, built once per size and materials
+_OPENING_MESHES = {}
+
+def _opening_mesh(name, frame_scale, panel_scale, frame_material, panel_material):
+    """Return the shared two-slot mesh of a frame box around a panel box, building it on first use"""
+    key = (name, frame_scale, panel_scale, frame_material, panel_material)
+    mesh = _OPENING_MESHES.get(key)
+    if mesh is None:
+        verts, faces = _box_geometry([(0, 0, 0, *frame_scale, 0), (0, 0, 0, *panel_scale, 0)])
+        # Slot 0 for the six frame faces, slot 1 for the six panel faces
+        face_materials = np.repeat(np.arange(2, dtype=np.int32), 6)
+        mesh = _quad_mesh(name, verts, faces, face_materials, [frame_material, panel_material])
+        _OPENING_MESHES[key] = mesh
+    return mesh
+
+def _add_light(name, light_type, location, rotation=(0, 0, 0), **settings):
+    """Create a light object from new light data, setting any extra light properties given"""
+    light = bpy.data.lights.new(name, light_type)
+    for setting, value in settings.items():
+        setattr(light, setting, value)
+    
+    obj = bpy.data.objects.new(name, light)
+    obj.location = location
+    obj.rotation_euler = rotation
+    _COLLECTION.objects.link(obj)
+    return obj
+
+def _add_camera(name, location, rotation=(0, 0, 0)):
+    """Create a camera object from new camera data"""
+    obj = bpy.data.objects.new(name, bpy.data.cameras.new(name))
+    obj.location = location
+    obj.rotation_euler = rotation
+    _COLLECTION.objects.link(obj)
+    return obj
+
+# Unit plane matching primitive_plane_add(size=1)
+_UNIT_PLANE_ARRAY = np.array([(-0.5, -0.5, 0), (0.5, -0.5, 0), (0.5, 0.5, 0), (-0.5, 0.5, 0)], dtype=np.float32)
+
+# Static geometry waiting to be written into the merged house mesh, with one
+# material per entry: boxes (walls, roof, furniture) as (x, y, z, sx, sy, sz, angle)
+# rows and axis-aligned floor planes as (x, y, z, sx, sy) rows
+_HOUSE_BOXES = []
+_HOUSE_BOX_MATERIALS = []
+_HOUSE_PLANES = []
+_HOUSE_PLANE_MATERIALS = []
+
+def _emit_box(location, scale, material, angle=0.0):
+    """Queue a box for the merged house mesh and return its index"""
+    _HOUSE_BOXES.append((*location, *scale, angle))
+    _HOUSE_BOX_MATERIALS.append(material)
+    return len(_HOUSE_BOXES) - 1
+
+def _emit_plane(location, size, material):
+    """Queue a horizontal plane for the merged house mesh and return its index"""
+    _HOUSE_PLANES.append((*location, *size))
+    _HOUSE_PLANE_MATERIALS.append(material)
+    return len(_HOUSE_PLANES) - 1
+
+def build_house_mesh(name="House"):
+    """Write every queued box and plane into one mesh object with a material slot per distinct material"""
+    box_verts, box_faces = _box_geometry(_HOUSE_BOXES)
+    planes = np.array(_HOUSE_PLANES, dtype=np.float32).reshape(-1, 5)
+    plane_count = len(planes)
+    
+    # Planes only need scaling in X and Y; their quads follow the box vertices
+    plane_verts = _UNIT_PLANE_ARRAY[None, :, :].repeat(plane_count, axis=0)
+    plane_verts[..., :2] *= planes[:, None, 3:5]
+    plane_verts += planes[:, None, :3]
+    plane_faces = np.arange(plane_count * 4, dtype=np.int32).reshape(-1, 4) + len(box_verts)
+    
+    # One slot per material, in first-use order; every face of a box or plane uses its slot
+    materials = list(dict.fromkeys(_HOUSE_BOX_MATERIALS + _HOUSE_PLANE_MATERIALS))
+    slot_index = {material: i for i, material in enumerate(materials)}
+    box_slots = np.array([slot_index[material] for material in _HOUSE_BOX_MATERIALS], dtype=np.int32)
+    plane_slots = np.array([slot_index[material] for material in _HOUSE_PLANE_MATERIALS], dtype=np.int32)
+    
+    mesh = _quad_mesh(name,
+                      np.concatenate((box_verts, plane_verts.reshape(-1, 3))),
+                      np.concatenate((box_faces, plane_faces)),
+                      np.concatenate((np.repeat(box_slots, 6), plane_slots)),
+                      materials)
+    house = _add_object(name, mesh)
+    
+    _HOUSE_BOXES.clear()
+    _HOUSE_BOX_MATERIALS.clear()
+    _HOUSE_PLANES.clear()
+    _HOUSE_PLANE_MATERIALS.clear()
+    return house
+
+# Materials built so far, keyed by kind (and colour/roughness where they vary),
+# so repeated calls hand back the same datablock instead of a new node tree
+_MATERIAL_CACHE = {}
 
 def create_realistic_material(name, base_color, roughness=0.5, metallic=0.0):
     """Create a realistic material with proper PBR properties"""
+    key = ('pbr', name, tuple(base_color), roughness, metallic)
+    if key in _MATERIAL_CACHE:
+        return _MATERIAL_CACHE[key]
+    
     material = bpy.data.materials.new(name=name)
     material.use_nodes = True
     nodes = material.node_tree.nodes
@@ -83,10 +228,15 @@ def create_realistic_material(name, base_color, roughness=0.5, metallic=0.0):
     # Link nodes
     links.new(principled.outputs[0], material_output.inputs[0])
     
+    _MATERIAL_CACHE[key] = material
     return material
 
 def create_wall_material():
     """Create realistic wall material with texture"""
+    key = 'wall'
+    if key in _MATERIAL_CACHE:
+        return _MATERIAL_CACHE[key]
+    
     material = bpy.data.materials.new(name="WallMaterial")
     material.use_nodes = True
     nodes = material.node_tree.nodes
@@ -122,10 +272,15 @@ def create_wall_material():
     links.new(ramp.outputs[0], principled.inputs[19])  # Normal map
     links.new(principled.outputs[0], material_output.inputs[0])
     
+    _MATERIAL_CACHE[key] = material
     return material
 
 def create_floor_material():
     """Create realistic wooden floor material"""
+    key = 'floor'
+    if key in _MATERIAL_CACHE:
+        return _MATERIAL_CACHE[key]
+    
     material = bpy.data.materials.new(name="FloorMaterial")
     material.use_nodes = True
     nodes = material.node_tree.nodes
@@ -161,10 +316,15 @@ def create_floor_material():
     links.new(ramp.outputs[0], principled.inputs[0])  # Base Color
     links.new(principled.outputs[0], material_output.inputs[0])
     
+    _MATERIAL_CACHE[key] = material
     return material
 
 def create_roof_material():
     """Create realistic roof material"""
+    key = 'roof'
+    if key in _MATERIAL_CACHE:
+        return _MATERIAL_CACHE[key]
+    
     material = bpy.data.materials.new(name="RoofMaterial")
     material.use_nodes = True
     nodes = material.node_tree.nodes
@@ -186,10 +346,15 @@ def create_roof_material():
     # Link nodes
     links.new(principled.outputs[0], material_output.inputs[0])
     
+    _MATERIAL_CACHE[key] = material
     return material
 
 def create_door_material():
     """Create realistic door material"""
+    key = 'door'
+    if key in _MATERIAL_CACHE:
+        return _MATERIAL_CACHE[key]
+    
     material = bpy.data.materials.new(name="DoorMaterial")
     material.use_nodes = True
     nodes = material.node_tree.nodes
@@ -211,10 +376,15 @@ def create_door_material():
     # Link nodes
     links.new(principled.outputs[0], material_output.inputs[0])
     
+    _MATERIAL_CACHE[key] = material
     return material
 
 def create_window_material():
     """Create realistic glass material"""
+    key = 'window'
+    if key in _MATERIAL_CACHE:
+        return _MATERIAL_CACHE[key]
+    
     material = bpy.data.materials.new(name="WindowMaterial")
     material.use_nodes = True
     nodes = material.node_tree.nodes
@@ -236,10 +406,15 @@ def create_window_material():
     # Link nodes
     links.new(principled.outputs[0], material_output.inputs[0])
     
+    _MATERIAL_CACHE[key] = material
     return material
 
 def create_furniture_material(color, roughness=0.6):
     """Create furniture material"""
+    key = ('furniture', tuple(color), roughness)
+    if key in _MATERIAL_CACHE:
+        return _MATERIAL_CACHE[key]
+    
     material = bpy.data.materials.new(name=f"FurnitureMaterial_{color[0]:.2f}")
     material.use_nodes = True
     nodes = material.node_tree.nodes
@@ -261,399 +436,186 @@ def create_furniture_material(color, roughness=0.6):
     # Link nodes
     links.new(principled.outputs[0], material_output.inputs[0])
     
+    _MATERIAL_CACHE[key] = material
     return material
 
-def create_realistic_wall(start, end, height, material, thickness=0.2):
-    """Create a realistic wall with proper thickness"""
-    # Calculate wall dimensions
-    length = ((end[0] - start[0])**2 + (end[1] - start[1])**2)**0.5
-    angle = math.atan2(end[1] - start[1], end[0] - start[0])
-    
-    # Create wall mesh with thickness
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    wall = bpy.context.active_object
-    wall.name = "Wall"
-    
-    # Position and scale
-    wall.location = ((start[0] + end[0])/2, (start[1] + end[1])/2, height/2)
-    wall.scale = (length, thickness, height)
-    wall.rotation_euler[2] = angle
-    
-    # Apply material
-    if wall.data.materials:
-        wall.data.materials[0] = material
-    else:
-        wall.data.materials.append(material)
-    
-    return wall
+def _merge_wall_segments(segments):
+    """Collapse walls shared by neighbouring rooms and join collinear walls that touch or overlap"""
+    # Axis-aligned walls grouped by the line they lie on, as (start, end) spans along it
+    lines = defaultdict(list)
+    # Any other wall is only de-duplicated, whichever way round it was given
+    slanted = {}
+    for x0, y0, x1, y1 in np.asarray(segments).tolist():
+        x0, y0, x1, y1 = round(x0, 3), round(y0, 3), round(x1, 3), round(y1, 3)
+        if y0 == y1:
+            lines[('horizontal', y0)].append((min(x0, x1), max(x0, x1)))
+        elif x0 == x1:
+            lines[('vertical', x0)].append((min(y0, y1), max(y0, y1)))
+        else:
+            slanted.setdefault(tuple(sorted(((x0, y0), (x1, y1)))), (x0, y0, x1, y1))
+    
+    merged = list(slanted.values())
+    for (direction, offset), spans in lines.items():
+        spans.sort()
+        runs = [list(spans[0])]
+        for start, end in spans[1:]:
+            if start <= runs[-1][1]:
+                runs[-1][1] = max(runs[-1][1], end)
+            else:
+                runs.append([start, end])
+        for start, end in runs:
+            if direction == 'horizontal':
+                merged.append((start, offset, end, offset))
+            else:
+                merged.append((offset, start, offset, end))
+    
+    return merged
 
-def create_realistic_room(room_data, wall_material, floor_material):
-    """Create a realistic room with proper walls and floor"""
-    x, y, width, height = room_data['x'], room_data['y'], room_data['width'], room_data['height']
-    wall_height = 3.0
-    wall_thickness = 0.2
-    
+def create_realistic_walls(segments, height, material, thickness=0.2):
+    """Create realistic walls with proper thickness along (x0, y0, x1, y1) segments"""
+    # Build each shared or collinear stretch of wall once
+    segments = _merge_wall_segments(segments)
+    
+    # Calculate wall dimensions for every segment at once
+    segments = np.asarray(segments, dtype=np.float32).reshape(-1, 4)
+    dx = segments[:, 2] - segments[:, 0]
+    dy = segments[:, 3] - segments[:, 1]
+    lengths = np.hypot(dx, dy)
+    angles = np.arctan2(dy, dx)
+    centers_x = (segments[:, 0] + segments[:, 2]) * 0.5
+    centers_y = (segments[:, 1] + segments[:, 3]) * 0.5
+    
+    # Create walls with thickness, positioned, scaled and turned along their segments
     walls = []
+    for cx, cy, length, angle in zip(centers_x.tolist(), centers_y.tolist(), lengths.tolist(), angles.tolist()):
+        walls.append(_emit_box((cx, cy, height/2), (length, thickness, height), material, angle=angle))
     
-    # Create four walls with thickness
-    # Wall 1: Bottom
-    walls.append(create_realistic_wall((x, y), (x + width, y), wall_height, wall_material, wall_thickness))
-    
-    # Wall 2: Right
-    walls.append(create_realistic_wall((x + width, y), (x + width, y + height), wall_height, wall_material, wall_thickness))
-    
-    # Wall 3: Top
-    walls.append(create_realistic_wall((x + width, y + height), (x, y + height), wall_height, wall_material, wall_thickness))
-    
-    # Wall 4: Left
-    walls.append(create_realistic_wall((x, y + height), (x, y), wall_height, wall_material, wall_thickness))
-    
-    # Create floor
-    bpy.ops.mesh.primitive_plane_add(size=1)
-    floor = bpy.context.active_object
-    floor.name = "Floor"
-    
-    floor.location = (x + width/2, y + height/2, 0)
-    floor.scale = (width/2, height/2, 1)
-    
-    if floor.data.materials:
-        floor.data.materials[0] = floor_material
-    else:
-        floor.data.materials.append(floor_material)
-    
-    return walls, floor
+    return walls
+
+def create_realistic_rooms(rooms, floor_material):
+    """Create realistic floors for (x, y, width, height) room rows and return their wall segments"""
+    x, y, width, height = np.asarray(rooms, dtype=np.float32).T
+    
+    # Four walls per room as (x0, y0, x1, y1): bottom, right, top, left
+    wall_segments = np.concatenate((
+        np.stack((x, y, x + width, y), axis=1),
+        np.stack((x + width, y, x + width, y + height), axis=1),
+        np.stack((x + width, y + height, x, y + height), axis=1),
+        np.stack((x, y + height, x, y), axis=1),
+    ))
+    
+    # Create floors
+    floors = []
+    for cx, cy, sx, sy in zip((x + width/2).tolist(), (y + height/2).tolist(), (width/2).tolist(), (height/2).tolist()):
+        floors.append(_emit_plane((cx, cy, 0), (sx, sy), floor_material))
+    
+    return wall_segments, floors
 
-def create_realistic_door(position, width=1.0, height=2.1):
+def create_realistic_door(position, frame_material, door_material, width=1.0, height=2.1):
     """Create a realistic door with frame"""
-    # Door frame
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    frame = bpy.context.active_object
-    frame.name = "DoorFrame"
-    
-    frame.location = position
-    frame.scale = (width/2 + 0.1, 0.15, height/2 + 0.1)
-    
-    frame_material = create_furniture_material((0.8, 0.8, 0.8, 1))  # White frame
-    if frame.data.materials:
-        frame.data.materials[0] = frame_material
-    else:
-        frame.data.materials.append(frame_material)
+    # Door frame and panel in one mesh, one material slot each
+    mesh = _opening_mesh("Door", (width/2 + 0.1, 0.15, height/2 + 0.1), (width/2, 0.05, height/2),
+                         frame_material, door_material)
+    door = _add_object("Door", mesh, position)
     
-    # Door panel
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    door = bpy.context.active_object
-    door.name = "Door"
-    
-    door.location = position
-    door.scale = (width/2, 0.05, height/2)
-    
-    door_material = create_door_material()
-    if door.data.materials:
-        door.data.materials[0] = door_material
-    else:
-        door.data.materials.append(door_material)
-    
-    return [frame, door]
+    return [door]
 
-def create_realistic_window(position, width=1.2, height=1.2):
+def create_realistic_window(position, frame_material, glass_material, width=1.2, height=1.2):
     """Create a realistic window with frame"""
-    # Window frame
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    frame = bpy.context.active_object
-    frame.name = "WindowFrame"
-    
-    frame.location = position
-    frame.scale = (width/2 + 0.1, 0.15, height/2 + 0.1)
-    
-    frame_material = create_furniture_material((0.9, 0.9, 0.9, 1))  # White frame
-    if frame.data.materials:
-        frame.data.materials[0] = frame_material
-    else:
-        frame.data.materials.append(frame_material)
-    
-    # Glass panel
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    glass = bpy.context.active_object
-    glass.name = "WindowGlass"
-    
-    glass.location = position
-    glass.scale = (width/2, 0.02, height/2)
-    
-    glass_material = create_window_material()
-    if glass.data.materials:
-        glass.data.materials[0] = glass_material
-    else:
-        glass.data.materials.append(glass_material)
+    # Window frame and glass panel in one mesh, one material slot each
+    mesh = _opening_mesh("Window", (width/2 + 0.1, 0.15, height/2 + 0.1), (width/2, 0.02, height/2),
+                         frame_material, glass_material)
+    window = _add_object("Window", mesh, position)
     
-    return [frame, glass]
+    return [window]
+
+# Furniture colours, indexed by the material column of _FURNITURE_PARTS
+_FURNITURE_COLORS = [
+    (0.6, 0.4, 0.2, 1),    # 0: Wooden / brown
+    (0.2, 0.3, 0.8, 1),    # 1: Blue
+    (0.4, 0.25, 0.15, 1),  # 2: Dark wood
+    (0.8, 0.7, 0.6, 1),    # 3: Beige
+    (0.3, 0.2, 0.1, 1),    # 4: Darker wood
+    (0.9, 0.9, 0.9, 1),    # 5: White
+    (0.8, 0.8, 0.8, 1),    # 6: Light gray
+    (0.7, 0.7, 0.7, 1),    # 7: Stainless steel
+    (0.2, 0.2, 0.2, 1),    # 8: Black
+]
+
+# Box parts of each piece of furniture, one (dx, dy, dz, sx, sy, sz, colour) row
+# per part, offset from the position the piece is placed at
+_FURNITURE_PARTS = {
+    'bed_single': np.array([
+        (0, 0, 0, 0.45, 1.0, 0.3, 0),      # Bed frame
+        (0, 0, 0.15, 0.4, 0.95, 0.15, 1),  # Mattress
+        (0, 0.9, 0.5, 0.45, 0.1, 0.5, 2),  # Headboard
+    ], dtype=np.float32),
+    'bed_double': np.array([
+        (0, 0, 0, 0.8, 1.0, 0.3, 0),       # Bed frame
+        (0, 0, 0.15, 0.75, 0.95, 0.15, 1), # Mattress
+        (0, 0.9, 0.5, 0.8, 0.1, 0.5, 2),   # Headboard
+    ], dtype=np.float32),
+    'sofa': np.array([
+        (0, 0, 0, 1.0, 0.4, 0.4, 0),       # Sofa base
+        (0, -0.3, 0.6, 1.0, 0.1, 0.6, 0),  # Sofa back
+        (-0.6, 0, 0.2, 0.4, 0.6, 0.1, 3),  # Cushions
+        (0.6, 0, 0.2, 0.4, 0.6, 0.1, 3),
+    ], dtype=np.float32),
+    'dining_table': np.array([
+        (0, 0, 0, 0.6, 0.4, 0.05, 2),           # Table top
+        (-0.5, -0.3, -0.35, 0.05, 0.05, 0.35, 2),  # Table legs
+        (0.5, -0.3, -0.35, 0.05, 0.05, 0.35, 2),
+        (-0.5, 0.3, -0.35, 0.05, 0.05, 0.35, 2),
+        (0.5, 0.3, -0.35, 0.05, 0.05, 0.35, 2),
+        (0, -0.6, -0.35, 0.4, 0.4, 0.05, 4),    # Chair seats and backs
+        (0, -0.8, -0.05, 0.4, 0.05, 0.3, 4),
+        (0, 0.6, -0.35, 0.4, 0.4, 0.05, 4),
+        (0, 0.4, -0.05, 0.4, 0.05, 0.3, 4),
+    ], dtype=np.float32),
+    'kitchen_counter': np.array([
+        (0, 0, 0, 1.0, 0.3, 0.9, 5),         # Counter base
+        (0, 0, 0.45, 1.0, 0.3, 0.05, 6),     # Counter top
+        (-0.3, 0, 0.47, 0.3, 0.4, 0.02, 7),  # Sink
+        (0.3, 0, 0.47, 0.3, 0.4, 0.02, 8),   # Stove
+    ], dtype=np.float32),
+}
+
+def create_furniture(kind, position):
+    """Place the parts of one piece of furniture from _FURNITURE_PARTS at position"""
+    parts = _FURNITURE_PARTS[kind]
+    locations = parts[:, :3] + np.asarray(position, dtype=np.float32)
+    materials = [create_furniture_material(_FURNITURE_COLORS[i]) for i in parts[:, 6].astype(int).tolist()]
+    
+    return [_emit_box(location, scale, material)
+            for location, scale, material in zip(locations.tolist(), parts[:, 3:6].tolist(), materials)]
 
 def create_realistic_bed(position, size="double"):
     """Create a realistic bed with headboard and mattress"""
-    if size == "single":
-        bed_width, bed_length = 0.9, 2.0
-    else:  # double
-        bed_width, bed_length = 1.6, 2.0
-    
-    # Bed frame
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    bed_frame = bpy.context.active_object
-    bed_frame.name = "BedFrame"
-    
-    bed_frame.location = position
-    bed_frame.scale = (bed_width/2, bed_length/2, 0.3)
-    
-    bed_material = create_furniture_material((0.6, 0.4, 0.2, 1))  # Wooden
-    if bed_frame.data.materials:
-        bed_frame.data.materials[0] = bed_material
-    else:
-        bed_frame.data.materials.append(bed_material)
-    
-    # Mattress
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    mattress = bpy.context.active_object
-    mattress.name = "Mattress"
-    
-    mattress.location = (position[0], position[1], position[2] + 0.15)
-    mattress.scale = (bed_width/2 - 0.05, bed_length/2 - 0.05, 0.15)
-    
-    mattress_material = create_furniture_material((0.2, 0.3, 0.8, 1))  # Blue
-    if mattress.data.materials:
-        mattress.data.materials[0] = mattress_material
-    else:
-        mattress.data.materials.append(mattress_material)
-    
-    # Headboard
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    headboard = bpy.context.active_object
-    headboard.name = "Headboard"
-    
-    headboard.location = (position[0], position[1] + bed_length/2 - 0.1, position[2] + 0.5)
-    headboard.scale = (bed_width/2, 0.1, 0.5)
-    
-    headboard_material = create_furniture_material((0.4, 0.25, 0.15, 1))  # Dark wood
-    if headboard.data.materials:
-        headboard.data.materials[0] = headboard_material
-    else:
-        headboard.data.materials.append(headboard_material)
-    
-    return [bed_frame, mattress, headboard]
+    return create_furniture('bed_single' if size == "single" else 'bed_double', position)
 
 def create_realistic_sofa(position):
     """Create a realistic sofa with cushions"""
-    # Sofa base
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    sofa_base = bpy.context.active_object
-    sofa_base.name = "SofaBase"
-    
-    sofa_base.location = position
-    sofa_base.scale = (2.0/2, 0.8/2, 0.4)
-    
-    sofa_material = create_furniture_material((0.6, 0.4, 0.2, 1))  # Brown
-    if sofa_base.data.materials:
-        sofa_base.data.materials[0] = sofa_material
-    else:
-        sofa_base.data.materials.append(sofa_material)
-    
-    # Sofa back
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    sofa_back = bpy.context.active_object
-    sofa_back.name = "SofaBack"
-    
-    sofa_back.location = (position[0], position[1] - 0.3, position[2] + 0.6)
-    sofa_back.scale = (2.0/2, 0.1, 0.6)
-    
-    if sofa_back.data.materials:
-        sofa_back.data.materials[0] = sofa_material
-    else:
-        sofa_back.data.materials.append(sofa_material)
-    
-    # Cushions
-    cushions = []
-    cushion_positions = [
-        (position[0] - 0.6, position[1], position[2] + 0.2),
-        (position[0] + 0.6, position[1], position[2] + 0.2),
-    ]
-    
-    for i, cushion_pos in enumerate(cushion_positions):
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        cushion = bpy.context.active_object
-        cushion.name = f"SofaCushion_{i}"
-        
-        cushion.location = cushion_pos
-        cushion.scale = (0.4, 0.6, 0.1)
-        
-        cushion_material = create_furniture_material((0.8, 0.7, 0.6, 1))  # Beige
-        if cushion.data.materials:
-            cushion.data.materials[0] = cushion_material
-        else:
-            cushion.data.materials.append(cushion_material)
-        
-        cushions.append(cushion)
-    
-    return [sofa_base, sofa_back] + cushions
+    return create_furniture('sofa', position)
 
 def create_realistic_dining_table(position):
     """Create a realistic dining table with chairs"""
-    # Table top
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    table = bpy.context.active_object
-    table.name = "DiningTable"
-    
-    table.location = position
-    table.scale = (1.2/2, 0.8/2, 0.05)
-    
-    table_material = create_furniture_material((0.4, 0.25, 0.15, 1))  # Dark wood
-    if table.data.materials:
-        table.data.materials[0] = table_material
-    else:
-        table.data.materials.append(table_material)
-    
-    # Table legs
-    legs = []
-    leg_positions = [
-        (position[0] - 0.5, position[1] - 0.3, position[2] - 0.35),
-        (position[0] + 0.5, position[1] - 0.3, position[2] - 0.35),
-        (position[0] - 0.5, position[1] + 0.3, position[2] - 0.35),
-        (position[0] + 0.5, position[1] + 0.3, position[2] - 0.35)
-    ]
-    
-    for i, leg_pos in enumerate(leg_positions):
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        leg = bpy.context.active_object
-        leg.name = f"TableLeg_{i}"
-        
-        leg.location = leg_pos
-        leg.scale = (0.05, 0.05, 0.35)
-        
-        if leg.data.materials:
-            leg.data.materials[0] = table_material
-        else:
-            leg.data.materials.append(table_material)
-        
-        legs.append(leg)
-    
-    # Chairs
-    chairs = []
-    chair_positions = [
-        (position[0], position[1] - 0.6, position[2] - 0.35),
-        (position[0], position[1] + 0.6, position[2] - 0.35),
-    ]
-    
-    for i, chair_pos in enumerate(chair_positions):
-        # Chair seat
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        chair_seat = bpy.context.active_object
-        chair_seat.name = f"ChairSeat_{i}"
-        
-        chair_seat.location = chair_pos
-        chair_seat.scale = (0.4, 0.4, 0.05)
-        
-        chair_material = create_furniture_material((0.3, 0.2, 0.1, 1))  # Dark wood
-        if chair_seat.data.materials:
-            chair_seat.data.materials[0] = chair_material
-        else:
-            chair_seat.data.materials.append(chair_material)
-        
-        chairs.append(chair_seat)
-        
-        # Chair back
-        bpy.ops.mesh.primitive_cube_add(size=1)
-        chair_back = bpy.context.active_object
-        chair_back.name = f"ChairBack_{i}"
-        
-        chair_back.location = (chair_pos[0], chair_pos[1] - 0.2, chair_pos[2] + 0.3)
-        chair_back.scale = (0.4, 0.05, 0.3)
-        
-        if chair_back.data.materials:
-            chair_back.data.materials[0] = chair_material
-        else:
-            chair_back.data.materials.append(chair_material)
-        
-        chairs.append(chair_back)
-    
-    return [table] + legs + chairs
+    return create_furniture('dining_table', position)
 
 def create_realistic_kitchen_counter(position):
     """Create a realistic kitchen counter with appliances"""
-    # Counter base
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    counter = bpy.context.active_object
-    counter.name = "KitchenCounter"
-    
-    counter.location = position
-    counter.scale = (2.0/2, 0.6/2, 0.9)
-    
-    counter_material = create_furniture_material((0.9, 0.9, 0.9, 1))  # White
-    if counter.data.materials:
-        counter.data.materials[0] = counter_material
-    else:
-        counter.data.materials.append(counter_material)
-    
-    # Counter top
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    counter_top = bpy.context.active_object
-    counter_top.name = "CounterTop"
-    
-    counter_top.location = (position[0], position[1], position[2] + 0.45)
-    counter_top.scale = (2.0/2, 0.6/2, 0.05)
-    
-    top_material = create_furniture_material((0.8, 0.8, 0.8, 1))  # Light gray
-    if counter_top.data.materials:
-        counter_top.data.materials[0] = top_material
-    else:
-        counter_top.data.materials.append(top_material)
-    
-    # Sink
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    sink = bpy.context.active_object
-    sink.name = "Sink"
-    
-    sink.location = (position[0] - 0.3, position[1], position[2] + 0.47)
-    sink.scale = (0.3, 0.4, 0.02)
-    
-    sink_material = create_furniture_material((0.7, 0.7, 0.7, 1))  # Stainless steel
-    if sink.data.materials:
-        sink.data.materials[0] = sink_material
-    else:
-        sink.data.materials.append(sink_material)
-    
-    # Stove
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    stove = bpy.context.active_object
-    stove.name = "Stove"
-    
-    stove.location = (position[0] + 0.3, position[1], position[2] + 0.47)
-    stove.scale = (0.3, 0.4, 0.02)
-    
-    stove_material = create_furniture_material((0.2, 0.2, 0.2, 1))  # Black
-    if stove.data.materials:
-        stove.data.materials[0] = stove_material
-    else:
-        stove.data.materials.append(stove_material)
-    
-    return [counter, counter_top, sink, stove]
+    return create_furniture('kitchen_counter', position)
 
 def create_realistic_roof(house_width, house_length, wall_height):
     """Create a realistic sloped roof"""
-    # Create roof mesh
-    bpy.ops.mesh.primitive_cube_add(size=1)
-    roof = bpy.context.active_object
-    roof.name = "Roof"
+    roof_material = create_roof_material()
     
     # Position roof above walls
-    roof.location = (house_width/2, house_length/2, wall_height + 1.5)
-    roof.scale = (house_width/2 + 0.5, house_length/2 + 0.5, 0.3)
-    
-    # Apply roof material
-    roof_material = create_roof_material()
-    if roof.data.materials:
-        roof.data.materials[0] = roof_material
-    else:
-        roof.data.materials.append(roof_material)
+    roof = _emit_box((house_width/2, house_length/2, wall_height + 1.5),
+                     (house_width/2 + 0.5, house_length/2 + 0.5, 0.3), roof_material)
     
     return roof
 
-def create_realistic_3bhk_house():
+def create_realistic_3bhk_house(furniture=frozenset()):
     """Create a realistic 3BHK house with proper architecture"""
     print(" Creating realistic 3BHK house...")
     
@@ -664,134 +626,139 @@ def create_realistic_3bhk_house():
     
     print(f"🏠 House Dimensions: {house_width}x{house_length}x{wall_height} meters")
     
-    # Create materials
-    wall_material = create_wall_material()
-    floor_material = create_floor_material()
-    
-    # Define room layouts for 3BHK
-    rooms = [
-        # Bedroom 1 (Master)
-        {'name': 'Master Bedroom', 'x': 0, 'y': 0, 'width': 4, 'height': 4},
-        # Bedroom 2
-        {'name': 'Bedroom 2', 'x': 4, 'y': 0, 'width': 4, 'height': 4},
-        # Bedroom 3
-        {'name': 'Bedroom 3', 'x': 8, 'y': 0, 'width': 4, 'height': 4},
-        # Kitchen
-        {'name': 'Kitchen', 'x': 0, 'y': 4, 'width': 6, 'height': 4},
-        # Living Room
-        {'name': 'Living Room', 'x': 6, 'y': 4, 'width': 8, 'height': 6},
-        # Dining Area
-        {'name': 'Dining Area', 'x': 6, 'y': 10, 'width': 6, 'height': 4},
-        # Bathroom 1
-        {'name': 'Bathroom 1', 'x': 12, 'y': 10, 'width': 2, 'height': 3},
-        # Bathroom 2
-        {'name': 'Bathroom 2', 'x': 14, 'y': 10, 'width': 2, 'height': 3},
-        # Entrance Hall
-        {'name': 'Entrance Hall', 'x': 0, 'y': 8, 'width': 6, 'height': 2},
-        # Balcony
-        {'name': 'Balcony', 'x': 0, 'y': 14, 'width': 6, 'height': 2},
-    ]
-    
-    # Create walls and floors for each room
-    all_walls = []
-    all_floors = []
-    
-    for room in rooms:
-        # Create realistic room
-        walls, floor = create_realistic_room(room, wall_material, floor_material)
-        all_walls.extend(walls)
-        all_floors.append(floor)
-    
-    # Create doors
-    doors = []
-    door_positions = [
-        (2, 8, 1.05),    # Entrance door
-        (2, 4, 1.05),    # Kitchen door
-        (6, 4, 1.05),    # Living room door
-        (8, 2, 1.05),    # Bedroom 1 door
-        (12, 2, 1.05),   # Bedroom 2 door
-        (16, 2, 1.05),   # Bedroom 3 door
-        (13, 10, 1.05),  # Bathroom 1 door
-        (15, 10, 1.05),  # Bathroom 2 door
-    ]
-    
-    for pos in door_positions:
-        door_parts = create_realistic_door(pos)
-        doors.extend(door_parts)
-    
-    # Create windows
-    windows = []
-    window_positions = [
-        (2, 0, 1.5),     # Bedroom 1 window
-        (6, 0, 1.5),     # Bedroom 2 window
-        (10, 0, 1.5),    # Bedroom 3 window
-        (3, 4, 1.5),     # Kitchen window
-        (10, 4, 1.5),    # Living room window 1
-        (14, 4, 1.5),    # Living room window 2
-    ]
-    
-    for pos in window_positions:
-        window_parts = create_realistic_window(pos)
-        windows.extend(window_parts)
-    
-    # Create realistic roof
-    roof = create_realistic_roof(house_width, house_length, wall_height)
-    
-    # Add furniture based on user preferences
-    furniture_objects = []
-    
-    if 'beds' in furniture_list:
-        # Add beds to bedrooms
-        bed_positions = [
-            (2, 2, 0.3),    # Master bedroom
-            (6, 2, 0.3),    # Bedroom 2
-            (10, 2, 0.3),   # Bedroom 3
+    # Lock the interface while the house is built; the depsgraph is updated once at the end
+    global _COLLECTION
+    _COLLECTION = bpy.context.collection
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    lock_interface = scene.render.use_lock_interface
+    scene.render.use_lock_interface = True
+    try:
+        # Create materials
+        wall_material = create_wall_material()
+        floor_material = create_floor_material()
+        door_frame_material = create_furniture_material((0.8, 0.8, 0.8, 1))  # White frame
+        door_material = create_door_material()
+        window_frame_material = create_furniture_material((0.9, 0.9, 0.9, 1))  # White frame
+        glass_material = create_window_material()
+        
+        # Define room layouts for 3BHK
+        rooms = np.array([
+            # Bedroom 1 (Master)
+            (0, 0, 4, 4),
+            # Bedroom 2
+            (4, 0, 4, 4),
+            # Bedroom 3
+            (8, 0, 4, 4),
+            # Kitchen
+            (0, 4, 6, 4),
+            # Living Room
+            (6, 4, 8, 6),
+            # Dining Area
+            (6, 10, 6, 4),
+            # Bathroom 1
+            (12, 10, 2, 3),
+            # Bathroom 2
+            (14, 10, 2, 3),
+            # Entrance Hall
+            (0, 8, 6, 2),
+            # Balcony
+            (0, 14, 6, 2),
+        ], dtype=np.float32)
+        
+        # Create floors for every room, then all of their walls in one pass
+        wall_segments, all_floors = create_realistic_rooms(rooms, floor_material)
+        all_walls = create_realistic_walls(wall_segments, wall_height, wall_material)
+        
+        # Create doors
+        doors = []
+        door_positions = [
+            (2, 8, 1.05),    # Entrance door
+            (2, 4, 1.05),    # Kitchen door
+            (6, 4, 1.05),    # Living room door
+            (8, 2, 1.05),    # Bedroom 1 door
+            (12, 2, 1.05),   # Bedroom 2 door
+            (16, 2, 1.05),   # Bedroom 3 door
+            (13, 10, 1.05),  # Bathroom 1 door
+            (15, 10, 1.05),  # Bathroom 2 door
+        ]
+        
+        for pos in door_positions:
+            door_parts = create_realistic_door(pos, door_frame_material, door_material)
+            doors.extend(door_parts)
+        
+        # Create windows
+        windows = []
+        window_positions = [
+            (2, 0, 1.5),     # Bedroom 1 window
+            (6, 0, 1.5),     # Bedroom 2 window
+            (10, 0, 1.5),    # Bedroom 3 window
+            (3, 4, 1.5),     # Kitchen window
+            (10, 4, 1.5),    # Living room window 1
+            (14, 4, 1.5),    # Living room window 2
         ]
         
-        for pos in bed_positions:
-            bed_parts = create_realistic_bed(pos, "double")
-            furniture_objects.extend(bed_parts)
-    
-    if 'sofa' in furniture_list:
-        # Add sofa to living room
-        sofa_parts = create_realistic_sofa((10, 7, 0.4))
-        furniture_objects.extend(sofa_parts)
-    
-    if 'dining_table' in furniture_list:
-        # Add dining table
-        table_parts = create_realistic_dining_table((9, 12, 0.4))
-        furniture_objects.extend(table_parts)
-    
-    if 'kitchen_counter' in furniture_list:
-        # Add kitchen counter
-        counter_parts = create_realistic_kitchen_counter((3, 6, 0.45))
-        furniture_objects.extend(counter_parts)
-    
-    # Setup realistic lighting
-    # Sun light
-    bpy.ops.object.light_add(type='SUN', location=(10, 10, 10))
-    sun = bpy.context.active_object
-    sun.data.energy = 3.0
-    sun.rotation_euler = (math.radians(45), math.radians(45), 0)
-    
-    # Ambient lighting
-    bpy.ops.object.light_add(type='AREA', location=(house_width/2, house_length/2, wall_height + 2))
-    ambient = bpy.context.active_object
-    ambient.data.energy = 2.0
-    ambient.data.size = 10.0
-    
-    # Setup camera
-    bpy.ops.object.camera_add(location=(25, -15, 15))
-    camera = bpy.context.active_object
-    camera.rotation_euler = (math.radians(60), 0, math.radians(45))
-    
-    # Set camera as active
-    bpy.context.scene.camera = camera
+        for pos in window_positions:
+            window_parts = create_realistic_window(pos, window_frame_material, glass_material)
+            windows.extend(window_parts)
+        
+        # Create realistic roof
+        roof = create_realistic_roof(house_width, house_length, wall_height)
+        
+        # Add furniture based on user preferences
+        furniture_objects = []
+        
+        if 'beds' in furniture:
+            # Add beds to bedrooms
+            bed_positions = [
+                (2, 2, 0.3),    # Master bedroom
+                (6, 2, 0.3),    # Bedroom 2
+                (10, 2, 0.3),   # Bedroom 3
+            ]
+        
+            for pos in bed_positions:
+                bed_parts = create_realistic_bed(pos, "double")
+                furniture_objects.extend(bed_parts)
+        
+        if 'sofa' in furniture:
+            # Add sofa to living room
+            sofa_parts = create_realistic_sofa((10, 7, 0.4))
+            furniture_objects.extend(sofa_parts)
+        
+        if 'dining_table' in furniture:
+            # Add dining table
+            table_parts = create_realistic_dining_table((9, 12, 0.4))
+            furniture_objects.extend(table_parts)
+        
+        if 'kitchen_counter' in furniture:
+            # Add kitchen counter
+            counter_parts = create_realistic_kitchen_counter((3, 6, 0.45))
+            furniture_objects.extend(counter_parts)
+        
+        # Write walls, floors, roof and furniture out as one mesh
+        build_house_mesh()
+        
+        # Setup realistic lighting
+        # Sun light
+        sun = _add_light("Sun", 'SUN', (10, 10, 10), (math.radians(45), math.radians(45), 0), energy=3.0)
+        
+        # Ambient lighting
+        ambient = _add_light("Area", 'AREA', (house_width/2, house_length/2, wall_height + 2), energy=2.0, size=10.0)
+        
+        # Setup camera
+        camera = _add_camera("Camera", (25, -15, 15), (math.radians(60), 0, math.radians(45)))
+        
+        # Set camera as active
+        scene.camera = camera
+        
+        view_layer.update()
+    finally:
+        scene.render.use_lock_interface = lock_interface
     
     print("✅ Realistic 3BHK house created successfully!")
     return len(all_walls) + len(all_floors) + len(doors) + len(windows) + 1 + len(furniture_objects)
 
-def create_realistic_duplex_house():
+def create_realistic_duplex_house(furniture=frozenset()):
     """Create a realistic duplex house with two floors"""
     print("🏗️ Creating realistic Duplex house...")
     
@@ -802,216 +769,244 @@ def create_realistic_duplex_house():
     
     print(f"🏠 House Dimensions: {house_width}x{house_length}x{wall_height} meters")
     
-    # Create materials
-    wall_material = create_wall_material()
-    floor_material = create_floor_material()
-    
-    # Define room layouts for Duplex (Ground Floor)
-    ground_floor_rooms = [
-        # Living Room
-        {'name': 'Living Room', 'x': 0, 'y': 0, 'width': 8, 'height': 6},
-        # Kitchen
-        {'name': 'Kitchen', 'x': 8, 'y': 0, 'width': 7, 'height': 4},
-        # Dining Area
-        {'name': 'Dining Area', 'x': 8, 'y': 4, 'width': 7, 'height': 4},
-        # Bathroom 1
-        {'name': 'Bathroom 1', 'x': 0, 'y': 6, 'width': 3, 'height': 3},
-        # Entrance Hall
-        {'name': 'Entrance Hall', 'x': 3, 'y': 6, 'width': 5, 'height': 3},
-        # Staircase
-        {'name': 'Staircase', 'x': 0, 'y': 9, 'width': 4, 'height': 4},
-    ]
-    
-    # Define room layouts for Duplex (First Floor)
-    first_floor_rooms = [
-        # Master Bedroom
-        {'name': 'Master Bedroom', 'x': 0, 'y': 0, 'width': 6, 'height': 5},
-        # Bedroom 2
-        {'name': 'Bedroom 2', 'x': 6, 'y': 0, 'width': 6, 'height': 5},
-        # Bedroom 3
-        {'name': 'Bedroom 3', 'x': 12, 'y': 0, 'width': 3, 'height': 5},
-        # Bathroom 2
-        {'name': 'Bathroom 2', 'x': 0, 'y': 5, 'width': 3, 'height': 3},
-        # Family Hall
-        {'name': 'Family Hall', 'x': 3, 'y': 5, 'width': 12, 'height': 4},
-        # Balcony
-        {'name': 'Balcony', 'x': 0, 'y': 9, 'width': 15, 'height': 2},
-    ]
-    
-    # Create ground floor
-    all_walls = []
-    all_floors = []
-    
-    # Ground floor rooms
-    for room in ground_floor_rooms:
-        walls, floor = create_realistic_room(room, wall_material, floor_material)
-        all_walls.extend(walls)
-        all_floors.append(floor)
-    
-    # Create first floor (elevated)
-    for room in first_floor_rooms:
-        # Adjust Y position for first floor
-        room['y'] += 13  # Elevate first floor
-        walls, floor = create_realistic_room(room, wall_material, floor_material)
-        all_walls.extend(walls)
-        all_floors.append(floor)
-    
-    # Create doors
-    doors = []
-    door_positions = [
-        # Ground floor doors
-        (4, 6, 1.05),    # Entrance door
-        (8, 0, 1.05),    # Kitchen door
-        (8, 4, 1.05),    # Dining door
-        (0, 6, 1.05),    # Bathroom 1 door
-        (2, 9, 1.05),    # Staircase door
-        # First floor doors
-        (3, 13, 4.05),   # Master bedroom door
-        (9, 13, 4.05),   # Bedroom 2 door
-        (13.5, 13, 4.05), # Bedroom 3 door
-        (1.5, 18, 4.05), # Bathroom 2 door
-    ]
-    
-    for pos in door_positions:
-        door_parts = create_realistic_door(pos)
-        doors.extend(door_parts)
-    
-    # Create windows
-    windows = []
-    window_positions = [
-        # Ground floor windows
-        (4, 0, 1.5),     # Living room window 1
-        (12, 0, 1.5),    # Kitchen window
-        (12, 4, 1.5),    # Dining window
-        # First floor windows
-        (3, 13, 4.5),    # Master bedroom window
-        (9, 13, 4.5),    # Bedroom 2 window
-        (13.5, 13, 4.5), # Bedroom 3 window
-        (7.5, 18, 4.5),  # Family hall window
-    ]
-    
-    for pos in window_positions:
-        window_parts = create_realistic_window(pos)
-        windows.extend(window_parts)
-    
-    # Create realistic roof for duplex
-    roof = create_realistic_roof(house_width, house_length, wall_height + 3)
-    
-    # Add furniture based on user preferences
-    furniture_objects = []
-    
-    if 'beds' in furniture_list:
-        # Add beds to bedrooms (first floor)
-        bed_positions = [
-            (3, 15, 3.3),    # Master bedroom
-            (9, 15, 3.3),    # Bedroom 2
-            (13.5, 15, 3.3), # Bedroom 3
+    # Lock the interface while the house is built; the depsgraph is updated once at the end
+    global _COLLECTION
+    _COLLECTION = bpy.context.collection
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    lock_interface = scene.render.use_lock_interface
+    scene.render.use_lock_interface = True
+    try:
+        # Create materials
+        wall_material = create_wall_material()
+        floor_material = create_floor_material()
+        door_frame_material = create_furniture_material((0.8, 0.8, 0.8, 1))  # White frame
+        door_material = create_door_material()
+        window_frame_material = create_furniture_material((0.9, 0.9, 0.9, 1))  # White frame
+        glass_material = create_window_material()
+        
+        # Define room layouts for Duplex (Ground Floor)
+        ground_floor_rooms = np.array([
+            # Living Room
+            (0, 0, 8, 6),
+            # Kitchen
+            (8, 0, 7, 4),
+            # Dining Area
+            (8, 4, 7, 4),
+            # Bathroom 1
+            (0, 6, 3, 3),
+            # Entrance Hall
+            (3, 6, 5, 3),
+            # Staircase
+            (0, 9, 4, 4),
+        ], dtype=np.float32)
+        
+        # Define room layouts for Duplex (First Floor)
+        first_floor_rooms = np.array([
+            # Master Bedroom
+            (0, 0, 6, 5),
+            # Bedroom 2
+            (6, 0, 6, 5),
+            # Bedroom 3
+            (12, 0, 3, 5),
+            # Bathroom 2
+            (0, 5, 3, 3),
+            # Family Hall
+            (3, 5, 12, 4),
+            # Balcony
+            (0, 9, 15, 2),
+        ], dtype=np.float32)
+        
+        # Create first floor (elevated): adjust Y position for first floor
+        first_floor_rooms[:, 1] += 13
+        
+        # Create floors for both storeys, then all of their walls in one pass
+        wall_segments, all_floors = create_realistic_rooms(np.concatenate((ground_floor_rooms, first_floor_rooms)),
+                                                           floor_material)
+        all_walls = create_realistic_walls(wall_segments, wall_height, wall_material)
+        
+        # Create doors
+        doors = []
+        door_positions = [
+            # Ground floor doors
+            (4, 6, 1.05),    # Entrance door
+            (8, 0, 1.05),    # Kitchen door
+            (8, 4, 1.05),    # Dining door
+            (0, 6, 1.05),    # Bathroom 1 door
+            (2, 9, 1.05),    # Staircase door
+            # First floor doors
+            (3, 13, 4.05),   # Master bedroom door
+            (9, 13, 4.05),   # Bedroom 2 door
+            (13.5, 13, 4.05), # Bedroom 3 door
+            (1.5, 18, 4.05), # Bathroom 2 door
+        ]
+        
+        for pos in door_positions:
+            door_parts = create_realistic_door(pos, door_frame_material, door_material)
+            doors.extend(door_parts)
+        
+        # Create windows
+        windows = []
+        window_positions = [
+            # Ground floor windows
+            (4, 0, 1.5),     # Living room window 1
+            (12, 0, 1.5),    # Kitchen window
+            (12, 4, 1.5),    # Dining window
+            # First floor windows
+            (3, 13, 4.5),    # Master bedroom window
+            (9, 13, 4.5),    # Bedroom 2 window
+            (13.5, 13, 4.5), # Bedroom 3 window
+            (7.5, 18, 4.5),  # Family hall window
         ]
         
-        for pos in bed_positions:
-            bed_parts = create_realistic_bed(pos, "double")
-            furniture_objects.extend(bed_parts)
-    
-    if 'sofa' in furniture_list:
-        # Add sofa to living room (ground floor)
-        sofa_parts = create_realistic_sofa((4, 3, 0.4))
-        furniture_objects.extend(sofa_parts)
-    
-    if 'dining_table' in furniture_list:
-        # Add dining table (ground floor)
-        table_parts = create_realistic_dining_table((11.5, 6, 0.4))
-        furniture_objects.extend(table_parts)
-    
-    if 'kitchen_counter' in furniture_list:
-        # Add kitchen counter (ground floor)
-        counter_parts = create_realistic_kitchen_counter((11.5, 2, 0.45))
-        furniture_objects.extend(counter_parts)
-    
-    # Setup realistic lighting
-    # Sun light
-    bpy.ops.object.light_add(type='SUN', location=(10, 10, 15))
-    sun = bpy.context.active_object
-    sun.data.energy = 3.0
-    sun.rotation_euler = (math.radians(45), math.radians(45), 0)
-    
-    # Ambient lighting
-    bpy.ops.object.light_add(type='AREA', location=(house_width/2, house_length/2, wall_height + 5))
-    ambient = bpy.context.active_object
-    ambient.data.energy = 2.0
-    ambient.data.size = 12.0
-    
-    # Setup camera
-    bpy.ops.object.camera_add(location=(25, -20, 20))
-    camera = bpy.context.active_object
-    camera.rotation_euler = (math.radians(60), 0, math.radians(45))
-    
-    # Set camera as active
-    bpy.context.scene.camera = camera
+        for pos in window_positions:
+            window_parts = create_realistic_window(pos, window_frame_material, glass_material)
+            windows.extend(window_parts)
+        
+        # Create realistic roof for duplex
+        roof = create_realistic_roof(house_width, house_length, wall_height + 3)
+        
+        # Add furniture based on user preferences
+        furniture_objects = []
+        
+        if 'beds' in furniture:
+            # Add beds to bedrooms (first floor)
+            bed_positions = [
+                (3, 15, 3.3),    # Master bedroom
+                (9, 15, 3.3),    # Bedroom 2
+                (13.5, 15, 3.3), # Bedroom 3
+            ]
+        
+            for pos in bed_positions:
+                bed_parts = create_realistic_bed(pos, "double")
+                furniture_objects.extend(bed_parts)
+        
+        if 'sofa' in furniture:
+            # Add sofa to living room (ground floor)
+            sofa_parts = create_realistic_sofa((4, 3, 0.4))
+            furniture_objects.extend(sofa_parts)
+        
+        if 'dining_table' in furniture:
+            # Add dining table (ground floor)
+            table_parts = create_realistic_dining_table((11.5, 6, 0.4))
+            furniture_objects.extend(table_parts)
+        
+        if 'kitchen_counter' in furniture:
+            # Add kitchen counter (ground floor)
+            counter_parts = create_realistic_kitchen_counter((11.5, 2, 0.45))
+            furniture_objects.extend(counter_parts)
+        
+        # Write walls, floors, roof and furniture out as one mesh
+        build_house_mesh()
+        
+        # Setup realistic lighting
+        # Sun light
+        sun = _add_light("Sun", 'SUN', (10, 10, 15), (math.radians(45), math.radians(45), 0), energy=3.0)
+        
+        # Ambient lighting
+        ambient = _add_light("Area", 'AREA', (house_width/2, house_length/2, wall_height + 5), energy=2.0, size=12.0)
+        
+        # Setup camera
+        camera = _add_camera("Camera", (25, -20, 20), (math.radians(60), 0, math.radians(45)))
+        
+        # Set camera as active
+        scene.camera = camera
+        
+        view_layer.update()
+    finally:
+        scene.render.use_lock_interface = lock_interface
     
     print("✅ Realistic Duplex house created successfully!")
     return len(all_walls) + len(all_floors) + len(doors) + len(windows) + 1 + len(furniture_objects)
 
-# Generate the house
-if args.house_type == "3BHK":
-    total_objects = create_realistic_3bhk_house()
-elif args.house_type == "Duplex":
-    total_objects = create_realistic_duplex_house()
-else:
-    print(f"❌ House type {args.house_type} not implemented yet")
-    total_objects = 0
-
-print(f"📦 Total objects created: {total_objects}")
-
-# Export the model with proper scene setup
-output_path = bpy.path.abspath(f"//{args.output}")
-print(f"💾 Exporting to: {output_path}")
-
-try:
-    # Ensure we have a proper scene setup
-    if len(bpy.context.scene.objects) == 0:
-        print("❌ No objects in scene to export")
-        exit(1)
-    
-    # Make sure all objects are visible and selectable
-    for obj in bpy.context.scene.objects:
-        obj.hide_viewport = False
-        obj.hide_render = False
-        obj.select_set(True)
-    
-    # Ensure we have a camera
-    if bpy.context.scene.camera is None:
-        print("⚠️ No camera found, creating default camera")
-        bpy.ops.object.camera_add(location=(10, -10, 10))
-        bpy.context.scene.camera = bpy.context.active_object
-    
-    # Ensure we have proper lighting
-    if not any(obj.type == 'LIGHT' for obj in bpy.context.scene.objects):
-        print("⚠️ No lights found, creating default lighting")
-        bpy.ops.object.light_add(type='SUN', location=(5, 5, 10))
-    
-    if args.format == 'glb':
-        bpy.ops.export_scene.gltf(
-            filepath=output_path,
-            export_format='GLB',
-            use_selection=False,
-            export_cameras=True,
-            export_lights=True,
-            export_extras=True
-        )
-    elif args.format == 'obj':
-        bpy.ops.export_scene.obj(
-            filepath=output_path,
-            use_selection=False
-        )
-    elif args.format == 'fbx':
-        bpy.ops.export_scene.fbx(
-            filepath=output_path,
-            use_selection=False
-        )
-    
-    print(f"✅ Successfully exported to: {output_path}")
-    
-except Exception as e:
-    print(f"❌ Export error: {e}")
-    import traceback
-    traceback.print_exc()
+def main(argv=None):
+    """Parse the options, build the requested house and export it"""
+    args = parse_args(argv)
+    
+    # Parse furniture list into a set for constant-time membership checks
+    furniture = frozenset(item.strip() for item in args.furniture.split(',') if item.strip())
+    
+    print("🏗️ Ultra-Realistic House Architecture Generator")
+    print("=" * 60)
+    print(f"📏 Land Area: {args.land} cents")
+    print(f"🏠 House Type: {args.house_type}")
+    print(f" Orientation: {args.orientation}")
+    print(f" Kitchen: {args.kitchen_size}")
+    print(f"🛋️ Living Room: {args.living_room}")
+    print(f" Bathrooms: {args.bathrooms}")
+    print(f" Balcony: {args.balcony}")
+    print(f"🚗 Parking: {args.parking}")
+    print(f"🌱 Garden: {args.garden}")
+    print(f"📚 Study Room: {args.study_room}")
+    print(f"🪑 Furniture: {sorted(furniture)}")
+    
+    # Clear existing scene
+    clear_scene()
+    
+    # Generate the house
+    if args.house_type == "3BHK":
+        total_objects = create_realistic_3bhk_house(furniture)
+    elif args.house_type == "Duplex":
+        total_objects = create_realistic_duplex_house(furniture)
+    else:
+        print(f"❌ House type {args.house_type} not implemented yet")
+        total_objects = 0
+    
+    print(f"📦 Total parts created: {total_objects}")
+    
+    # Export the model with proper scene setup
+    output_path = bpy.path.abspath(f"//{args.output}")
+    print(f"💾 Exporting to: {output_path}")
+    
+    try:
+        # Ensure we have a proper scene setup
+        if len(bpy.context.scene.objects) == 0:
+            print("❌ No objects in scene to export")
+            exit(1)
+        
+        # Make sure all objects are visible and selectable
+        for obj in bpy.context.scene.objects:
+            obj.hide_viewport = False
+            obj.hide_render = False
+            obj.select_set(True)
+        
+        # Ensure we have a camera
+        if bpy.context.scene.camera is None:
+            print("⚠️ No camera found, creating default camera")
+            bpy.context.scene.camera = _add_camera("Camera", (10, -10, 10))
+        
+        # Ensure we have proper lighting
+        if not any(obj.type == 'LIGHT' for obj in bpy.context.scene.objects):
+            print("⚠️ No lights found, creating default lighting")
+            _add_light("Sun", 'SUN', (5, 5, 10))
+        
+        if args.format == 'glb':
+            bpy.ops.export_scene.gltf(
+                filepath=output_path,
+                export_format='GLB',
+                use_selection=False,
+                export_cameras=True,
+                export_lights=True,
+                export_extras=True
+            )
+        elif args.format == 'obj':
+            bpy.ops.export_scene.obj(
+                filepath=output_path,
+                use_selection=False
+            )
+        elif args.format == 'fbx':
+            bpy.ops.export_scene.fbx(
+                filepath=output_path,
+                use_selection=False
+            )
+        
+        print(f"✅ Successfully exported to: {output_path}")
+    
+    except Exception as e:
+        print(f"❌ Export error: {e}")
+        import traceback
+        traceback.print_exc()
+
+# Only build and export when run as a script (blender -P); importing just defines the builders
+if __name__ == "__main__":
+    main()